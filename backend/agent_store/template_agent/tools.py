@@ -4,6 +4,9 @@ Template tools for a custom AgentVerse agent.
 All functions decorated with @agent_tool are auto-discovered and become part of
 the agent's capability set. Replace the placeholders below with logic that
 talks to your systems, runs scripts, or implements business workflows.
+
+Idempotent tools (lookups, searches) can use @agent_tool_cached instead, so a
+repeated call with the same arguments reuses the earlier result for a while.
 """
 
 from typing import Any, Dict
@@ -4,7 +4,8 @@ RESTful endpoints for group management
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
 from typing import List
 import os
 
@@ -16,9 +17,16 @@ from src.api.v1.dependencies import get_orchestrator_service
 class CreateGroupRequest(BaseModel):
     """Request model for creating a new group"""
     name: str = Field(
-        ..., min_length=1, max_length=100, description="Group name"
+        ..., max_length=100, description="Group name"
     )
 
+    @field_validator("name")
+    @classmethod
+    def _name_not_empty(cls, v: str) -> str:
+        if not v:
+            raise ValueError("Group name must not be empty")
+        return v
+
 
 class GroupResponse(BaseModel):
     """Response model for group information"""
@@ -28,6 +36,16 @@ class GroupResponse(BaseModel):
     updated_at: float = Field(..., description="Last update timestamp")
 
 
+def _group_payload(group: dict) -> dict:
+    """GroupResponse fields of a stored group, ready for orjson"""
+    return {
+        "id": group["id"],
+        "name": group["name"],
+        "created_at": group["created_at"],
+        "updated_at": group["updated_at"]
+    }
+
+
 class AddAgentRequest(BaseModel):
     """Request model for adding an agent to a group"""
     agent_key: str = Field(..., description="Agent identifier key")
@@ -36,7 +54,9 @@ class AddAgentRequest(BaseModel):
 router = APIRouter()
 
 
-@router.get("/", response_model=List[GroupResponse])
+# Group payloads are plain dicts encoded with orjson directly; GroupResponse
+# only documents the schema in OpenAPI
+@router.get("/", response_model=None, responses={200: {"model": List[GroupResponse]}})
 async def list_groups(
     service: OrchestratorService = Depends(get_orchestrator_service)
 ):
@@ -47,20 +67,12 @@ async def list_groups(
     """
     try:
         groups = service.list_groups()
-        return [
-            GroupResponse(
-                id=group["id"],
-                name=group["name"],
-                created_at=group["created_at"],
-                updated_at=group["updated_at"]
-            )
-            for group in groups
-        ]
+        return ORJSONResponse([_group_payload(group) for group in groups])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list groups: {str(e)}")
 
 
-@router.post("/", response_model=GroupResponse)
+@router.post("/", response_model=None, responses={200: {"model": GroupResponse}})
 async def create_group(
     request: CreateGroupRequest,
     service: OrchestratorService = Depends(get_orchestrator_service)
@@ -80,12 +92,7 @@ async def create_group(
         if not group:
             raise HTTPException(status_code=500, detail="Failed to retrieve created group")
 
-        return GroupResponse(
-            id=group["id"],
-            name=group["name"],
-            created_at=group["created_at"],
-            updated_at=group["updated_at"]
-        )
+        return ORJSONResponse(_group_payload(group))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create group: {str(e)}")
 
@@ -6,6 +6,7 @@ RESTful endpoints for accessing and analyzing log data
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any, Optional
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
@@ -56,6 +57,14 @@ def parse_human_readable_logs(file_path: Path) -> List[str]:
     return lines
 
 
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it does not exist"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
 @router.get("/sessions")
 async def list_log_sessions():
     """List all available log sessions"""
@@ -65,24 +74,32 @@ async def list_log_sessions():
         return {"sessions": []}
 
     sessions = []
-    for session_dir in base_log_dir.iterdir():
-        if session_dir.is_dir() and session_dir.name not in ['startup']:
+    # os.scandir exposes the directory-entry type from readdir and caches
+    # stat(), avoiding the repeated stat() calls of Path.iterdir()/is_dir()
+    with os.scandir(base_log_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir() or entry.name in ['startup']:
+                continue
+
+            dir_stat = entry.stat()
             session_info = {
-                "session_id": session_dir.name,
-                "created_at": datetime.fromtimestamp(session_dir.stat().st_ctime).isoformat(),
-                "modified_at": datetime.fromtimestamp(session_dir.stat().st_mtime).isoformat(),
-                "has_events": (session_dir / "events.jsonl").exists(),
-                "has_readable_logs": (session_dir / "session.log").exists()
+                "session_id": entry.name,
+                "created_at": datetime.fromtimestamp(dir_stat.st_ctime).isoformat(),
+                "modified_at": datetime.fromtimestamp(dir_stat.st_mtime).isoformat(),
+                "has_events": False,
+                "has_readable_logs": False
             }
 
-            # Get log file sizes
-            events_file = session_dir / "events.jsonl"
-            session_file = session_dir / "session.log"
+            # Get log file sizes (one stat per file instead of exists() + stat())
+            events_stat = _stat_or_none(os.path.join(entry.path, "events.jsonl"))
+            session_stat = _stat_or_none(os.path.join(entry.path, "session.log"))
 
-            if events_file.exists():
-                session_info["events_size"] = events_file.stat().st_size
-            if session_file.exists():
-                session_info["session_log_size"] = session_file.stat().st_size
+            if events_stat is not None:
+                session_info["has_events"] = True
+                session_info["events_size"] = events_stat.st_size
+            if session_stat is not None:
+                session_info["has_readable_logs"] = True
+                session_info["session_log_size"] = session_stat.st_size
 
             sessions.append(session_info)
 
@@ -4,6 +4,7 @@ Uses Official Anthropic MCP SDK for validation and testing
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 import json
@@ -12,6 +13,8 @@ from pathlib import Path
 
 from src.core.validation.mcp_validator import McpValidator
 from src.core.mcp.client import MCPManager
+from src.core.utils.json_files import read_json, write_json_atomic
+from src.core.utils.stat_cache import stat_cache
 
 router = APIRouter()
 
@@ -20,6 +23,36 @@ BACKEND_CONFIG_PATH = Path("config")
 BACKEND_CONFIG_PATH.mkdir(parents=True, exist_ok=True)
 
 
+def _save_mcp_config(mcp_path: Path, mcps: Dict[str, Any]) -> None:
+    """
+    Write the MCP configuration to disk in compact JSON form.
+
+    mcp.json is machine-consumed; GET /?pretty=true re-indents on the fly
+    for human viewing.
+    """
+    write_json_atomic(mcp_path, mcps, pretty=False)
+    stat_cache.record_count(mcp_path, len(mcps["mcpServers"]))
+
+
+def _load_mcp_config(mcp_path: Path) -> Dict[str, Any]:
+    """
+    Load the MCP configuration, guaranteeing the mcpServers wrapper.
+
+    Files in the old format (direct server mapping) are migrated in memory,
+    so callers can always index mcps["mcpServers"] directly. Reads never
+    touch the file; the new format is persisted by the next write.
+    """
+    if not mcp_path.exists():
+        return {"mcpServers": {}}
+
+    mcps = read_json(mcp_path)
+
+    if "mcpServers" not in mcps:
+        mcps = {"mcpServers": mcps}  # Migrate old format
+
+    return mcps
+
+
 # Request models
 class MCPRequest(BaseModel):
     """Modern MCP server request - simplified format"""
@@ -30,23 +63,19 @@ class MCPRequest(BaseModel):
 
 # MCP Management Endpoints
 @router.get("/")
-async def get_mcp_servers():
+async def get_mcp_servers(pretty: bool = False):
     """Get all available MCP servers from mcp.json"""
     try:
         mcp_path = BACKEND_CONFIG_PATH / "mcp.json"
-        if mcp_path.exists():
-            with open(mcp_path, 'r') as f:
-                mcps = json.load(f)
-
-            # Handle new format with mcpServers wrapper
-            if "mcpServers" in mcps:
-                servers = mcps["mcpServers"]
-                return {"mcpServers": servers, "count": len(servers)}
-            else:
-                # Handle old format (direct server mapping)
-                return {"mcpServers": mcps, "count": len(mcps)}
-
-        return {"mcpServers": {}, "count": 0}
+        servers = _load_mcp_config(mcp_path)["mcpServers"]
+        payload = {"mcpServers": servers, "count": len(servers)}
+
+        if pretty:
+            return Response(
+                content=json.dumps(payload, indent=2),
+                media_type="application/json"
+            )
+        return payload
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load MCP servers: {str(e)}")
 
@@ -97,14 +126,7 @@ async def add_mcp_server(mcp_id: str, mcp_data: MCPRequest):
         mcp_path = BACKEND_CONFIG_PATH / "mcp.json"
 
         # Load existing MCPs
-        mcps = {}
-        if mcp_path.exists():
-            with open(mcp_path, 'r') as f:
-                mcps = json.load(f)
-
-        # Ensure mcpServers structure exists
-        if "mcpServers" not in mcps:
-            mcps = {"mcpServers": mcps}  # Migrate old format
+        mcps = _load_mcp_config(mcp_path)
 
         # Check if MCP already exists
         if mcp_id in mcps["mcpServers"]:
@@ -114,8 +136,7 @@ async def add_mcp_server(mcp_id: str, mcp_data: MCPRequest):
         mcps["mcpServers"][mcp_id] = server_config
 
         # Save back to file
-        with open(mcp_path, 'w') as f:
-            json.dump(mcps, f, indent=2)
+        _save_mcp_config(mcp_path, mcps)
 
         return {
             "message": f"MCP server '{mcp_id}' added successfully",
@@ -178,13 +199,8 @@ async def update_mcp_server(mcp_id: str, mcp_data: MCPRequest):
         if not mcp_path.exists():
             raise HTTPException(status_code=404, detail="MCP configuration file not found")
 
-        with open(mcp_path, 'r') as f:
-            mcps = json.load(f)
-
-        # Handle new format with mcpServers wrapper
-        servers = mcps
-        if "mcpServers" in mcps:
-            servers = mcps["mcpServers"]
+        mcps = _load_mcp_config(mcp_path)
+        servers = mcps["mcpServers"]
 
         # Check if MCP exists
         if mcp_id not in servers:
@@ -193,13 +209,8 @@ async def update_mcp_server(mcp_id: str, mcp_data: MCPRequest):
         # Update MCP with simplified format
         servers[mcp_id] = server_config
 
-        # Update the original structure
-        if "mcpServers" in mcps:
-            mcps["mcpServers"] = servers
-
         # Save back to file
-        with open(mcp_path, 'w') as f:
-            json.dump(mcps, f, indent=2)
+        _save_mcp_config(mcp_path, mcps)
 
         return {
             "message": f"MCP server '{mcp_id}' updated successfully",
@@ -223,13 +234,8 @@ async def delete_mcp_server(mcp_id: str):
         if not mcp_path.exists():
             raise HTTPException(status_code=404, detail="MCP configuration file not found")
 
-        with open(mcp_path, 'r') as f:
-            mcps = json.load(f)
-
-        # Handle new format with mcpServers wrapper
-        servers = mcps
-        if "mcpServers" in mcps:
-            servers = mcps["mcpServers"]
+        mcps = _load_mcp_config(mcp_path)
+        servers = mcps["mcpServers"]
 
         # Check if MCP exists
         if mcp_id not in servers:
@@ -238,13 +244,8 @@ async def delete_mcp_server(mcp_id: str):
         # Delete MCP
         del servers[mcp_id]
 
-        # Update the original structure
-        if "mcpServers" in mcps:
-            mcps["mcpServers"] = servers
-
         # Save back to file
-        with open(mcp_path, 'w') as f:
-            json.dump(mcps, f, indent=2)
+        _save_mcp_config(mcp_path, mcps)
 
         return {
             "message": f"MCP server '{mcp_id}' deleted successfully",
@@ -6,10 +6,14 @@ Handle settings.json management via API
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any
-import json
+import asyncio
 import os
+import shutil
 from pathlib import Path
 
+from src.core.utils.stat_cache import stat_cache
+from src.core.utils.json_files import write_json_atomic
+
 router = APIRouter()
 
 # Configuration file paths
@@ -40,10 +44,7 @@ async def get_settings():
 
         # Load overrides from settings.json if exists
         settings_path = BACKEND_CONFIG_PATH / "settings.json"
-        overrides = {}
-        if settings_path.exists():
-            with open(settings_path, 'r') as f:
-                overrides = json.load(f)
+        overrides = stat_cache.load_json(settings_path) or {}
 
         # Merge settings
         final_settings = {**settings_dict, **overrides}
@@ -64,17 +65,14 @@ async def update_settings(settings_request: SettingsRequest):
         settings_path = BACKEND_CONFIG_PATH / "settings.json"
 
         # Load existing overrides
-        existing_overrides = {}
-        if settings_path.exists():
-            with open(settings_path, 'r') as f:
-                existing_overrides = json.load(f)
+        existing_overrides = stat_cache.load_json(settings_path) or {}
 
         # Merge with new settings
         updated_overrides = {**existing_overrides, **settings_request.settings}
 
         # Save overrides to settings.json
-        with open(settings_path, 'w') as f:
-            json.dump(updated_overrides, f, indent=2)
+        write_json_atomic(settings_path, updated_overrides)
+        stat_cache.record_count(settings_path, len(updated_overrides))
 
         # Refresh settings cache to pick up changes
         from src.core.config.settings import refresh_settings
@@ -95,14 +93,18 @@ async def reset_settings():
     try:
         settings_path = BACKEND_CONFIG_PATH / "settings.json"
 
-        if settings_path.exists():
+        # Remove unconditionally: a cached stat may be up to a second stale
+        try:
             os.remove(settings_path)
-            # Refresh settings cache to pick up changes
-            from src.core.config.settings import refresh_settings
-            refresh_settings()
-            return {"message": "Settings reset to defaults successfully"}
-        else:
+        except FileNotFoundError:
+            stat_cache.invalidate(settings_path)
             return {"message": "No settings overrides found, already using defaults"}
+
+        stat_cache.invalidate(settings_path)
+        # Refresh settings cache to pick up changes
+        from src.core.config.settings import refresh_settings
+        refresh_settings()
+        return {"message": "Settings reset to defaults successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to reset settings: {str(e)}")
 
@@ -143,37 +145,55 @@ async def validate_settings():
 
 
 # Configuration Status and Backup
+CONFIG_FILES = ["tools.json", "mcp.json", "settings.json"]
+
+
+def _copy_config_file(src: Path, dst: Path) -> None:
+    """
+    Copy a config file with its metadata (like shutil.copy2).
+
+    Uses os.copy_file_range where available so the data is copied in-kernel
+    (and reflinked on filesystems that support it), falling back to shutil.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+
+
 @router.post("/backup/")
 async def create_backup():
     """Create a backup of current configuration files"""
     try:
-        import shutil
         from datetime import datetime
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_dir = BACKEND_CONFIG_PATH / f"backup_{timestamp}"
-        os.makedirs(backup_dir, exist_ok=True)
 
-        # Backup configuration files
-        files_backed_up = []
+        # Backup configuration files that exist
+        files_backed_up = [
+            name for name in CONFIG_FILES
+            if stat_cache.get(BACKEND_CONFIG_PATH / name) is not None
+        ]
 
-        # Backup tools.json
-        tools_path = BACKEND_CONFIG_PATH / "tools.json"
-        if tools_path.exists():
-            shutil.copy2(tools_path, backup_dir / "tools.json")
-            files_backed_up.append("tools.json")
-
-        # Backup mcp.json
-        mcp_path = BACKEND_CONFIG_PATH / "mcp.json"
-        if mcp_path.exists():
-            shutil.copy2(mcp_path, backup_dir / "mcp.json")
-            files_backed_up.append("mcp.json")
-
-        # Backup settings.json
-        settings_path = BACKEND_CONFIG_PATH / "settings.json"
-        if settings_path.exists():
-            shutil.copy2(settings_path, backup_dir / "settings.json")
-            files_backed_up.append("settings.json")
+        os.makedirs(backup_dir, exist_ok=True)
+        await asyncio.gather(*(
+            asyncio.to_thread(
+                _copy_config_file, BACKEND_CONFIG_PATH / name, backup_dir / name
+            )
+            for name in files_backed_up
+        ))
 
         return {
             "message": "Backup created successfully",
@@ -189,42 +209,35 @@ async def create_backup():
 async def get_config_status():
     """Get status of all configuration files"""
     try:
+        tools_path = BACKEND_CONFIG_PATH / "tools.json"
+        mcp_path = BACKEND_CONFIG_PATH / "mcp.json"
+        settings_path = BACKEND_CONFIG_PATH / "settings.json"
+
+        # Entry counts are cached per (mtime, size) and recorded by the write
+        # endpoints, so polling does not parse the files (tools.json can
+        # embed large code strings) just to count their keys
+        tools_count = stat_cache.count_entries(tools_path)
+        mcp_count = stat_cache.count_entries(mcp_path, container="mcpServers")
+        overrides_count = stat_cache.count_entries(settings_path)
+
         status = {
             "tools": {
-                "exists": (BACKEND_CONFIG_PATH / "tools.json").exists(),
-                "path": str(BACKEND_CONFIG_PATH / "tools.json"),
-                "count": 0
+                "exists": tools_count is not None,
+                "path": str(tools_path),
+                "count": tools_count or 0
             },
             "mcp": {
-                "exists": (BACKEND_CONFIG_PATH / "mcp.json").exists(),
-                "path": str(BACKEND_CONFIG_PATH / "mcp.json"),
-                "count": 0
+                "exists": mcp_count is not None,
+                "path": str(mcp_path),
+                "count": mcp_count or 0
             },
             "settings": {
-                "overrides_exist": (BACKEND_CONFIG_PATH / "settings.json").exists(),
-                "overrides_path": str(BACKEND_CONFIG_PATH / "settings.json"),
-                "overrides_count": 0
+                "overrides_exist": overrides_count is not None,
+                "overrides_path": str(settings_path),
+                "overrides_count": overrides_count or 0
             }
         }
 
-        # Count tools
-        if status["tools"]["exists"]:
-            with open(BACKEND_CONFIG_PATH / "tools.json", 'r') as f:
-                tools = json.load(f)
-                status["tools"]["count"] = len(tools)
-
-        # Count MCPs
-        if status["mcp"]["exists"]:
-            with open(BACKEND_CONFIG_PATH / "mcp.json", 'r') as f:
-                mcps = json.load(f)
-                status["mcp"]["count"] = len(mcps)
-
-        # Count settings overrides
-        if status["settings"]["overrides_exist"]:
-            with open(BACKEND_CONFIG_PATH / "settings.json", 'r') as f:
-                overrides = json.load(f)
-                status["settings"]["overrides_count"] = len(overrides)
-
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get config status: {str(e)}")
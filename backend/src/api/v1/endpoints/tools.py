@@ -5,12 +5,14 @@ Handle tools.json management via API
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List
-import json
+from typing import Any, Dict, List, Optional
+import asyncio
 import os
 from pathlib import Path
 
 from src.core.validation.tool_validator import ToolValidator
+from src.core.utils.json_files import write_json_atomic
+from src.core.utils.stat_cache import stat_cache
 
 router = APIRouter()
 
@@ -30,15 +32,74 @@ class ToolRequest(BaseModel):
     functions: List[str]
 
 
+async def _validate_tool_request(tool_data: ToolRequest) -> None:
+    """
+    Validate tool configuration and code, raising HTTP 400 on failure.
+
+    Both validators are synchronous (AST walks, and importing the tool code
+    in the execution check), so they run in worker threads and keep the event
+    loop free for other requests. The code is only executed once the
+    configuration check has passed.
+    """
+    validation_result = await asyncio.to_thread(
+        ToolValidator.validate_tool_config,
+        name=tool_data.name,
+        description=tool_data.description,
+        category=tool_data.category,
+        code=tool_data.code,
+        functions=tool_data.functions
+    )
+
+    if not validation_result.valid:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "Tool configuration validation failed",
+                "validation_errors": validation_result.to_dict()
+            }
+        )
+
+    if tool_data.code.strip():
+        code_validation_result = await asyncio.to_thread(
+            ToolValidator.validate_tool_code_execution,
+            code=tool_data.code,
+            function_names=tool_data.functions
+        )
+        if not code_validation_result.valid:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": "Tool code validation failed",
+                    "validation_errors": code_validation_result.to_dict()
+                }
+            )
+
+
+def _load_tools(tools_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load tools.json for modification, or None if it does not exist.
+
+    The parse is shared through stat_cache and only repeated when the file's
+    mtime/size change; a shallow copy is returned so callers can add or
+    remove entries without touching the cached object.
+    """
+    tools = stat_cache.load_json(tools_path)
+    return dict(tools) if tools is not None else None
+
+
+def _save_tools(tools_path: Path, tools: Dict[str, Any]) -> None:
+    """Atomically write tools.json and record its new entry count"""
+    write_json_atomic(tools_path, tools)
+    stat_cache.record_count(tools_path, len(tools))
+
+
 # Tools Management Endpoints
 @router.get("/")
 async def get_tools():
     """Get all available tools from tools.json"""
     try:
-        tools_path = BACKEND_CONFIG_PATH / "tools.json"
-        if tools_path.exists():
-            with open(tools_path, 'r') as f:
-                tools = json.load(f)
+        tools = stat_cache.load_json(BACKEND_CONFIG_PATH / "tools.json")
+        if tools is not None:
             return {"tools": tools, "count": len(tools)}
         return {"tools": {}, "count": 0}
     except Exception as e:
@@ -51,49 +112,14 @@ async def get_tools():
 async def add_tool(tool_id: str, tool_data: ToolRequest):
     """Add a new tool to tools.json with validation"""
     try:
-        # Step 1: Validate Tool Configuration
-        validation_result = ToolValidator.validate_tool_config(
-            name=tool_data.name,
-            description=tool_data.description,
-            category=tool_data.category,
-            code=tool_data.code,
-            functions=tool_data.functions
-        )
-
-        if not validation_result.valid:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "Tool configuration validation failed",
-                    "validation_errors": validation_result.to_dict()
-                }
-            )
-
-        # Step 2: Validate Code Execution
-        if tool_data.code.strip():
-            code_validation_result = (
-                ToolValidator.validate_tool_code_execution(
-                    code=tool_data.code,
-                    function_names=tool_data.functions
-                )
-            )
-            if not code_validation_result.valid:
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "message": "Tool code validation failed",
-                        "validation_errors": code_validation_result.to_dict()
-                    }
-                )
+        # Step 1-2: Validate Tool Configuration and Code Execution
+        await _validate_tool_request(tool_data)
 
         # Step 3: Save Tool
         tools_path = BACKEND_CONFIG_PATH / "tools.json"
 
         # Load existing tools
-        tools = {}
-        if tools_path.exists():
-            with open(tools_path, 'r') as f:
-                tools = json.load(f)
+        tools = _load_tools(tools_path) or {}
 
         # Check if tool already exists
         if tool_id in tools:
@@ -105,8 +131,7 @@ async def add_tool(tool_id: str, tool_data: ToolRequest):
         tools[tool_id] = tool_data.dict()
 
         # Save back to file
-        with open(tools_path, 'w') as f:
-            json.dump(tools, f, indent=2)
+        _save_tools(tools_path, tools)
 
         return {
             "message": f"Tool '{tool_id}' added successfully",
@@ -122,58 +147,75 @@ async def add_tool(tool_id: str, tool_data: ToolRequest):
         )
 
 
-@router.put("/{tool_id}")
-async def update_tool(tool_id: str, tool_data: ToolRequest):
-    """Update an existing tool in tools.json with validation"""
+@router.post("/bulk")
+async def add_tools_bulk(tools_data: Dict[str, ToolRequest]):
+    """
+    Add several tools to tools.json in one request.
+
+    Every tool is validated first; tools.json is then read once, updated and
+    written once, instead of one full read/serialize/write cycle per tool.
+    Nothing is saved if any tool fails validation or already exists.
+    """
     try:
-        # Step 1: Validate Tool Configuration
-        validation_result = ToolValidator.validate_tool_config(
-            name=tool_data.name,
-            description=tool_data.description,
-            category=tool_data.category,
-            code=tool_data.code,
-            functions=tool_data.functions
-        )
+        if not tools_data:
+            raise HTTPException(status_code=400, detail="No tools provided")
+
+        # Step 1-2: Validate every tool before touching the file
+        for tool_id, tool_data in tools_data.items():
+            try:
+                await _validate_tool_request(tool_data)
+            except HTTPException as e:
+                e.detail["tool_id"] = tool_id
+                raise
+
+        # Step 3: Save Tools
+        tools_path = BACKEND_CONFIG_PATH / "tools.json"
+        tools = _load_tools(tools_path) or {}
 
-        if not validation_result.valid:
+        existing = [tool_id for tool_id in tools_data if tool_id in tools]
+        if existing:
             raise HTTPException(
                 status_code=400,
-                detail={
-                    "message": "Tool configuration validation failed",
-                    "validation_errors": validation_result.to_dict()
-                }
+                detail=f"Tools already exist: {', '.join(existing)}"
             )
 
-        # Step 2: Validate Code Execution
-        if tool_data.code.strip():
-            code_validation_result = (
-                ToolValidator.validate_tool_code_execution(
-                    code=tool_data.code,
-                    function_names=tool_data.functions
-                )
-            )
-            if not code_validation_result.valid:
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "message": "Tool code validation failed",
-                        "validation_errors": code_validation_result.to_dict()
-                    }
-                )
+        tools.update(
+            (tool_id, tool_data.dict()) for tool_id, tool_data in tools_data.items()
+        )
+        _save_tools(tools_path, tools)
+
+        return {
+            "message": f"{len(tools_data)} tools added successfully",
+            "tool_ids": list(tools_data),
+            "total_tools": len(tools),
+            "validation_passed": True
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to add tools: {str(e)}"
+        )
+
+
+@router.put("/{tool_id}")
+async def update_tool(tool_id: str, tool_data: ToolRequest):
+    """Update an existing tool in tools.json with validation"""
+    try:
+        # Step 1-2: Validate Tool Configuration and Code Execution
+        await _validate_tool_request(tool_data)
 
         # Step 3: Update Tool
         tools_path = BACKEND_CONFIG_PATH / "tools.json"
 
         # Load existing tools
-        if not tools_path.exists():
+        tools = _load_tools(tools_path)
+        if tools is None:
             raise HTTPException(
                 status_code=404,
                 detail="Tools configuration file not found"
             )
 
-        with open(tools_path, 'r') as f:
-            tools = json.load(f)
-
         # Check if tool exists
         if tool_id not in tools:
             raise HTTPException(
@@ -184,8 +226,7 @@ async def update_tool(tool_id: str, tool_data: ToolRequest):
         tools[tool_id] = tool_data.dict()
 
         # Save back to file
-        with open(tools_path, 'w') as f:
-            json.dump(tools, f, indent=2)
+        _save_tools(tools_path, tools)
 
         return {
             "message": f"Tool '{tool_id}' updated successfully",
@@ -207,15 +248,13 @@ async def delete_tool(tool_id: str):
         tools_path = BACKEND_CONFIG_PATH / "tools.json"
 
         # Load existing tools
-        if not tools_path.exists():
+        tools = _load_tools(tools_path)
+        if tools is None:
             raise HTTPException(
                 status_code=404,
                 detail="Tools configuration file not found"
             )
 
-        with open(tools_path, 'r') as f:
-            tools = json.load(f)
-
         # Check if tool exists
         if tool_id not in tools:
             raise HTTPException(
@@ -226,8 +265,7 @@ async def delete_tool(tool_id: str):
         del tools[tool_id]
 
         # Save back to file
-        with open(tools_path, 'w') as f:
-            json.dump(tools, f, indent=2)
+        _save_tools(tools_path, tools)
 
         return {
             "message": f"Tool '{tool_id}' deleted successfully",
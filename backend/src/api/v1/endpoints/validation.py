@@ -3,15 +3,25 @@ Validation API Endpoints
 Handle configuration validation using the same logic as registry.py
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import asyncio
+import hashlib
+import re
+import time
+
+import orjson
 
 from src.core.validation.agent_validator import AgentValidator
 from src.core.validation.tool_validator import ToolValidator
 from src.core.validation.mcp_validator import McpValidator
 
-router = APIRouter()
+# Responses are plain dicts from ValidationResult.to_dict(); serialize them
+# with orjson directly instead of walking them through jsonable_encoder
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # Request models
@@ -33,184 +43,273 @@ class MCPRequest(BaseModel):
     config: Optional[Dict[str, Any]] = None
 
 
+class AgentValidateRequest(BaseModel):
+    """Agent configuration to validate (unknown keys are ignored)"""
+    model_config = ConfigDict(extra="ignore")
+
+    name: str = ""
+    description: str = ""
+    emoji: str = "🔧"
+    tools_code: Optional[str] = None
+    mcp_config: Optional[Dict[str, Any]] = None
+    key: Optional[str] = None
+    llm_config: Optional[Dict[str, Any]] = None
+    selected_tools: Optional[List[str]] = None
+    selected_mcps: Optional[List[str]] = None
+
+
+class AgentFolderRequest(BaseModel):
+    """Existing agent folder to validate"""
+    model_config = ConfigDict(extra="ignore")
+
+    folder_path: str = ""
+
+
+class ToolCodeRequest(BaseModel):
+    """Tool code to compile and register in isolation"""
+    model_config = ConfigDict(extra="ignore")
+
+    code: str = ""
+    function_names: List[str] = []
+
+
+class MCPConnectivityRequest(BaseModel):
+    """MCP server to start and probe"""
+    model_config = ConfigDict(extra="ignore")
+
+    name: str = "test_server"
+    config: Dict[str, Any] = {}
+    timeout: float = 10.0
+
+
+# Validators built once at import, one per request model; every endpoint
+# validates the raw body bytes straight into its model in pydantic-core,
+# skipping the intermediate dict FastAPI would build
+AGENT_ADAPTER = TypeAdapter(AgentValidateRequest)
+AGENT_FOLDER_ADAPTER = TypeAdapter(AgentFolderRequest)
+TOOL_ADAPTER = TypeAdapter(ToolRequest)
+TOOL_CODE_ADAPTER = TypeAdapter(ToolCodeRequest)
+MCP_ADAPTER = TypeAdapter(MCPRequest)
+MCP_CONNECTIVITY_ADAPTER = TypeAdapter(MCPConnectivityRequest)
+
+
+def _json_body(model: type) -> Dict[str, Any]:
+    """OpenAPI requestBody for endpoints that parse the raw body themselves"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+
+async def _parse_body(request: Request, adapter: TypeAdapter) -> Any:
+    """Validate the raw JSON body, reporting errors as FastAPI's usual 422"""
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+# Agent folders are given relative to the backend directory. Both patterns are
+# compiled once and are linear-time: a single character class, and a fixed
+# alternation for absolute paths and ".." segments
+_FOLDER_PATH_RE = re.compile(r'[\w .\\/-]+')
+_UNSAFE_FOLDER_PATH_RE = re.compile(r'^[\\/]|(?:^|[\\/])\.\.(?:[\\/]|$)')
+
+
 # ===== VALIDATION ENDPOINTS =====
 # These endpoints validate configurations before creation/modification
 # using the same logic as registry.py
 
-@router.post("/agent/")
-async def validate_agent_config(request: dict):
+@router.post("/agent/", response_model=None, openapi_extra=_json_body(AgentValidateRequest))
+async def validate_agent_config(request: Request):
     """
     Validate agent configuration before creation/modification.
     Uses the COMPLETE agent building process to test runtime
     functionality.
     """
-    try:
-        result = await AgentValidator.validate_agent_config(
-            name=request.get("name", ""),
-            description=request.get("description", ""),
-            emoji=request.get("emoji", "🔧"),
-            tools_code=request.get("tools_code"),
-            mcp_config=request.get("mcp_config"),
-            agent_key=request.get("key"),
-            llm_config=request.get("llm_config"),
-            selected_tools=request.get("selected_tools"),
-            selected_mcps=request.get("selected_mcps")
-        )
-
-        return result.to_dict()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to validate agent config: {str(e)}"
-        )
-
-
-@router.post("/agent/folder/")
-async def validate_agent_folder(request: dict):
+    agent_data = await _parse_body(request, AGENT_ADAPTER)
+    result = await AgentValidator.validate_agent_config(
+        name=agent_data.name,
+        description=agent_data.description,
+        emoji=agent_data.emoji,
+        tools_code=agent_data.tools_code,
+        mcp_config=agent_data.mcp_config,
+        agent_key=agent_data.key,
+        llm_config=agent_data.llm_config,
+        selected_tools=agent_data.selected_tools,
+        selected_mcps=agent_data.selected_mcps
+    )
+
+    return ORJSONResponse(result.to_dict())
+
+
+@router.post("/agent/folder/", response_model=None, openapi_extra=_json_body(AgentFolderRequest))
+async def validate_agent_folder(request: Request):
     """
     Validate existing agent folder structure.
     Uses the exact same logic as discover_agents() in registry.py.
     """
-    try:
-        folder_path = request.get("folder_path", "")
+    folder_data = await _parse_body(request, AGENT_FOLDER_ADAPTER)
+    folder_path = folder_data.folder_path
 
-        if not folder_path:
-            raise HTTPException(
-                status_code=400, detail="folder_path is required"
-            )
-
-        result = AgentValidator.validate_agent_folder(folder_path)
+    if not folder_path:
+        raise HTTPException(
+            status_code=400, detail="folder_path is required"
+        )
 
-        return result.to_dict()
-    except HTTPException:
-        raise
-    except Exception as e:
+    if (not _FOLDER_PATH_RE.fullmatch(folder_path)
+            or _UNSAFE_FOLDER_PATH_RE.search(folder_path)):
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to validate agent folder: {str(e)}"
+            status_code=400,
+            detail="folder_path must be a relative path without '..' segments"
         )
 
+    result = AgentValidator.validate_agent_folder(folder_path)
+
+    return result.to_dict()
 
-@router.post("/tool/")
-async def validate_tool_config(tool_data: ToolRequest):
+
+@router.post("/tool/", response_model=None, openapi_extra=_json_body(ToolRequest))
+async def validate_tool_config(request: Request):
     """
     Validate tool configuration before creation/modification.
     Uses the exact same validation logic as tool registration.
     """
-    try:
-        result = ToolValidator.validate_tool_config(
-            name=tool_data.name,
-            description=tool_data.description,
-            category=tool_data.category,
-            code=tool_data.code,
-            functions=tool_data.functions
-        )
+    tool_data = await _parse_body(request, TOOL_ADAPTER)
+    result = ToolValidator.validate_tool_config(
+        name=tool_data.name,
+        description=tool_data.description,
+        category=tool_data.category,
+        code=tool_data.code,
+        functions=tool_data.functions
+    )
 
-        return result.to_dict()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to validate tool config: {str(e)}"
-        )
+    return result.to_dict()
 
 
-@router.post("/tool/code/")
-async def validate_tool_code(request: dict):
+@router.post("/tool/code/", response_model=None, openapi_extra=_json_body(ToolCodeRequest))
+async def validate_tool_code(request: Request):
     """
     Validate tool code execution without saving.
     Tests compilation and execution in isolation.
     """
-    try:
-        code = request.get("code", "")
-        function_names = request.get("function_names", [])
+    code_data = await _parse_body(request, TOOL_CODE_ADAPTER)
+    # Compiles and executes the submitted code: keep it off the event loop
+    result = await asyncio.to_thread(
+        ToolValidator.validate_tool_code_execution,
+        code_data.code, code_data.function_names
+    )
 
-        result = ToolValidator.validate_tool_code_execution(
-            code, function_names
-        )
+    return ORJSONResponse(result.to_dict())
 
-        return result.to_dict()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to validate tool code: {str(e)}"
-        )
 
-
-@router.post("/mcp/")
-async def validate_mcp_config(mcp_data: MCPRequest):
+@router.post("/mcp/", response_model=None, openapi_extra=_json_body(MCPRequest))
+async def validate_mcp_config(request: Request):
     """
     Validate MCP server configuration before creation/modification.
     Uses the exact same validation logic as MCP server initialization.
     """
-    try:
-        result = McpValidator.validate_mcp_server_config(
-            name=mcp_data.name,
-            description=mcp_data.description,
-            category=mcp_data.category,
-            config=mcp_data.config
-        )
+    mcp_data = await _parse_body(request, MCP_ADAPTER)
+    result = McpValidator.validate_mcp_server_config(
+        name=mcp_data.name,
+        description=mcp_data.description,
+        category=mcp_data.category,
+        config=mcp_data.config
+    )
+
+    return result.to_dict()
+
+
+# Each connectivity probe spawns the MCP server process. Forms re-poll while
+# being edited, so recent results are reused for a few seconds, and
+# concurrent probes of the same server wait for the one already running.
+CONNECTIVITY_CACHE_TTL = 5.0
+_CONN_CACHE: Dict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]] = {}
+_CONN_LOCKS: Dict[Tuple[str, bytes], asyncio.Lock] = {}
 
-        return result.to_dict()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to validate MCP config: {str(e)}"
-        )
 
+def _cached_connectivity(key: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Return a probe result younger than the TTL, if any"""
+    cached = _CONN_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CONNECTIVITY_CACHE_TTL:
+        return cached[1]
+    return None
 
-@router.post("/mcp/connectivity/")
-async def validate_mcp_connectivity(request: dict):
+
+@router.post("/mcp/connectivity/", response_model=None, openapi_extra=_json_body(MCPConnectivityRequest))
+async def validate_mcp_connectivity(request: Request):
     """
     Test MCP server connectivity without persistent connection.
     Validates that the command exists and responds correctly.
     """
-    try:
-        name = request.get("name", "test_server")
-        config = request.get("config", {})
-        timeout = request.get("timeout", 10.0)
+    mcp_data = await _parse_body(request, MCP_CONNECTIVITY_ADAPTER)
+    key = (mcp_data.name, orjson.dumps(mcp_data.config, option=orjson.OPT_SORT_KEYS))
+
+    cached = _cached_connectivity(key)
+    if cached is not None:
+        return cached
+
+    lock = _CONN_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        # A probe that finished while we waited for the lock is reused
+        cached = _cached_connectivity(key)
+        if cached is not None:
+            return cached
 
         result = await McpValidator.validate_mcp_server_connectivity(
-            name, config, timeout
+            mcp_data.name, mcp_data.config, mcp_data.timeout
         )
+        result_dict = result.to_dict()
 
-        return result.to_dict()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to test MCP connectivity: {str(e)}"
-        )
+        now = time.monotonic()
+        for stale_key in [
+            k for k, (ts, _) in _CONN_CACHE.items()
+            if now - ts >= CONNECTIVITY_CACHE_TTL
+        ]:
+            _CONN_CACHE.pop(stale_key, None)
+            _CONN_LOCKS.pop(stale_key, None)
+        _CONN_CACHE[key] = (now, result_dict)
+
+    return result_dict
 
 
 # Template endpoints
-@router.get("/templates/tools/")
-async def get_tool_templates():
+# Templates are constant for the life of the process: serialize each payload
+# once and serve the cached bytes with an ETag so browsers can revalidate (304)
+_STATIC_RESPONSES: Dict[str, Tuple[bytes, str]] = {}
+
+
+def _static_json_response(
+    request: Request, key: str, build: Callable[[], Any]
+) -> Response:
+    """Serve a constant JSON payload from cached bytes with ETag support"""
+    cached = _STATIC_RESPONSES.get(key)
+    if cached is None:
+        body = orjson.dumps(build())
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        cached = _STATIC_RESPONSES[key] = (body, etag)
+
+    body, etag = cached
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/templates/tools/", response_model=None)
+async def get_tool_templates(request: Request):
     """Get common tool templates and patterns"""
-    try:
-        templates = ToolValidator.get_common_tool_patterns()
-        code_template = ToolValidator.get_tool_code_template()
+    return _static_json_response(request, "tools", lambda: {
+        "templates": ToolValidator.get_common_tool_patterns(),
+        "base_template": ToolValidator.get_tool_code_template()
+    })
 
-        return {
-            "templates": templates,
-            "base_template": code_template
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get tool templates: {str(e)}"
-        )
 
-
-@router.get("/templates/mcp/")
-async def get_mcp_templates():
+@router.get("/templates/mcp/", response_model=None)
+async def get_mcp_templates(request: Request):
     """Get common MCP server templates"""
-    try:
-        templates = McpValidator.get_common_mcp_templates()
-
-        return {
-            "templates": templates
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get MCP templates: {str(e)}"
-        )
+    return _static_json_response(request, "mcp", lambda: {
+        "templates": McpValidator.get_common_mcp_templates()
+    })
@@ -3,11 +3,23 @@
 # Purpose: Enhanced agent with LangChain LLM and self-reflection planning loop
 # =========================================
 from __future__ import annotations
+import asyncio
+import functools
+import hashlib
 import inspect
 import json
-from typing import Any, Callable, Dict, List, Optional
-
-from src.core.llm.factory import get_llm
+import logging
+import re
+import reprlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+from src.core.llm.factory import get_cached_llm
+from src.core.memory import session_store
 from src.core.telemetry.events import (
     emit_agent_thought,
     emit_error,
@@ -20,16 +32,67 @@ from src.core.telemetry.session_logger import session_logger
 from .response_models import (
     FinalResponse,
     MCPCallResponse,
+    ParallelCallsResponse,
     SelfReflectResponse,
     ToolCallResponse,
     get_response_schema,
     parse_agent_response,
 )
 
+logger = logging.getLogger(__name__)
+
 # Constants
 MAX_CONVERSATION_HISTORY = 20
 MAX_PLANNING_STEPS = 8
 MAX_VALIDATION_ATTEMPTS = 3
+MAX_PARALLEL_CALLS = 8
+# Validation wall deadline: CORRECTION_TIMEOUT_FACTOR * smoothed latency + slack
+CORRECTION_TIMEOUT_FACTOR = 2.0
+CORRECTION_TIMEOUT_SLACK = 0.5
+CORRECTION_LATENCY_SMOOTHING = 0.2
+
+# Smoothed latency (seconds) of validation-wall correction requests, per
+# (provider, model); bounds how long the wall waits for a rewrite
+_correction_latency: Dict[Tuple[Any, Any], float] = {}
+
+
+def _correction_budget(latency_key: Tuple[Any, Any]) -> Optional[float]:
+    """Seconds to wait for a correction from this model, or None while its latency is unknown"""
+    ewma = _correction_latency.get(latency_key)
+    if ewma is None:
+        return None
+    return CORRECTION_TIMEOUT_FACTOR * ewma + CORRECTION_TIMEOUT_SLACK
+
+
+def _record_correction_latency(latency_key: Tuple[Any, Any], elapsed: float) -> None:
+    """Fold one observed wait into the model's smoothed latency (timeouts included)"""
+    ewma = _correction_latency.get(latency_key)
+    _correction_latency[latency_key] = elapsed if ewma is None else (
+        CORRECTION_LATENCY_SMOOTHING * elapsed + (1 - CORRECTION_LATENCY_SMOOTHING) * ewma
+    )
+
+
+# Validated validation-wall rewrites, keyed by the static system prompt head
+# (agent, tools, roster, rules) and the correction prompt, which quotes the
+# invalid response verbatim; the per-turn history is left out so the same
+# failed response can hit again in a later turn
+_CORRECTION_CACHE_SIZE = 256
+_correction_cache: "OrderedDict[bytes, str]" = OrderedDict()
+# Results of @agent_tool_cached tools kept per agent, least recently used first
+_TOOL_RESULT_CACHE_SIZE = 128
+
+
+def _correction_cache_key(prompt_head: str, error_msg: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(prompt_head.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(error_msg.encode("utf-8"))
+    return digest.digest()
+
+# Compiled once; used on every final response by the validation wall
+MENTION_PATTERN = re.compile(r"@([A-Za-z0-9_\-]+)")
+# Start of a mention, for counting mentions chunk by chunk while streaming
+_MENTION_START = re.compile(r"@(?=[A-Za-z0-9_\-])")
 
 
 def agent_tool(fn: Callable):
@@ -38,13 +101,374 @@ def agent_tool(fn: Callable):
     return fn
 
 
+def agent_tool_cached(fn: Optional[Callable] = None, *, ttl: float = 300):
+    """
+    Decorator for idempotent tools (lookups, searches, reads).
+
+    Like @agent_tool, but a call with the same arguments as one made less
+    than `ttl` seconds ago returns that result instead of running the tool
+    again. Usable bare (@agent_tool_cached) or with a ttl (@agent_tool_cached(ttl=60)).
+    """
+    def decorate(func: Callable) -> Callable:
+        setattr(func, "__agent_tool__", True)
+        setattr(func, "__cacheable__", ttl)
+        return func
+
+    return decorate(fn) if fn is not None else decorate
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _json_str(obj: Any) -> str:
+    """Serialize tool/MCP payloads for messages and prompts (orjson, str() fallback)"""
+    try:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+    except TypeError:
+        # e.g. integers wider than 64 bits, which orjson rejects
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+# Compact separators match orjson's output, so previews and full payloads agree
+_PREVIEW_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def _json_preview(obj: Any, limit: int) -> str:
+    """
+    First `limit` characters of the JSON form of obj.
+
+    iterencode() yields the document piece by piece, so encoding stops once
+    `limit` characters exist instead of serializing a multi-MB MCP payload
+    only to keep its first few KB.
+    """
+    parts: List[str] = []
+    size = 0
+    try:
+        for chunk in _PREVIEW_ENCODER.iterencode(obj):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+    except TypeError:
+        # e.g. dict keys json cannot encode but orjson's OPT_NON_STR_KEYS can
+        return _json_str(obj)[:limit]
+    return "".join(parts)[:limit]
+
+
+def _make_preview_repr(limit: int) -> reprlib.Repr:
+    preview_repr = reprlib.Repr()
+    preview_repr.maxstring = limit
+    preview_repr.maxother = limit
+    preview_repr.maxlist = preview_repr.maxtuple = 10
+    preview_repr.maxdict = preview_repr.maxset = 10
+    return preview_repr
+
+
+_PREVIEW_REPR = _make_preview_repr(200)
+
+
+def _truncated_repr(obj: Any, limit: int) -> str:
+    """
+    First `limit` characters of a display form of obj.
+
+    Unlike str(obj)[:limit], large containers are never rendered in full:
+    reprlib stops after the first few items and shortens long strings.
+    """
+    if isinstance(obj, str):
+        return obj[:limit]
+    return _PREVIEW_REPR.repr(obj)[:limit]
+
+
+def _sole_mention(text: str) -> Optional[str]:
+    """Name of the only @mention in text, or None if there are none or several"""
+    # str.find jumps between '@' characters; the regex only runs anchored at each
+    sole = None
+    at = text.find("@")
+    while at != -1:
+        match = MENTION_PATTERN.match(text, at)
+        if match:
+            if sole is not None:
+                return None  # a second mention: no need to scan the rest
+            sole = match.group(1)
+        at = text.find("@", at + 1)
+    return sole
+
+
+async def _stream_single_mention_reply(llm: Any, messages: List[Dict[str, str]]) -> str:
+    """
+    Stream a reply, abandoning it as soon as a second @mention appears.
+
+    Mentions are counted per chunk (carrying the previous chunk's last
+    character for an '@' split across chunks), so the buffer is never
+    re-scanned. A reply cut short this way fails the one-mention check.
+    """
+    chunks: List[str] = []
+    mention_count = 0
+    carry = ""
+    stream = llm.chat_stream(messages)
+    try:
+        async for chunk in stream:
+            if not isinstance(chunk, str) or not chunk:
+                continue
+            chunks.append(chunk)
+            mention_count += len(_MENTION_START.findall(carry + chunk))
+            if mention_count > 1:
+                break
+            carry = chunk[-1]
+    finally:
+        await stream.aclose()
+    return "".join(chunks)
+
+
+# Planner actions that are complete once their JSON object closes; a final
+# answer may still have a trailing @mention after it (see response_models)
+_EARLY_STOP_ACTIONS = frozenset({"call_tool", "call_mcp", "parallel_calls"})
+
+
+async def _stream_decision(llm: Any, system_message: Dict[str, Any], user: str) -> str:
+    """
+    Stream a planner reply, returning as soon as a tool/MCP action is complete.
+
+    Braces are tracked outside JSON strings while chunks arrive; when the first
+    top-level object closes and it is a tool, MCP or parallel action, that
+    object is returned and the rest of the generation (closing fences, a
+    repeated action, commentary) is abandoned, so the call starts without
+    waiting for the stream to end. Anything else is read to the end.
+    """
+    chunks: List[str] = []
+    offset = 0
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    scanning = True
+    stream = llm.chat_stream([system_message, {"role": "user", "content": user}])
+    try:
+        async for chunk in stream:
+            if not isinstance(chunk, str) or not chunk:
+                continue
+            chunks.append(chunk)
+            if scanning:
+                for i, ch in enumerate(chunk):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == "\\":
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"':
+                        in_string = depth > 0
+                    elif ch == "{":
+                        if depth == 0:
+                            start = offset + i
+                        depth += 1
+                    elif ch == "}" and depth:
+                        depth -= 1
+                        if depth:
+                            continue
+                        candidate = "".join(chunks)[start:offset + i + 1]
+                        try:
+                            data = orjson.loads(candidate)
+                        except orjson.JSONDecodeError:
+                            continue  # a brace in prose: keep looking
+                        action = data.get("action") if isinstance(data, dict) else None
+                        if action in _EARLY_STOP_ACTIONS:
+                            return candidate
+                        scanning = False
+                        break
+            offset += len(chunk)
+    finally:
+        await stream.aclose()
+    return "".join(chunks)
+
+
+def _truncate_middle(text: str, head: int = 512, tail: int = 512) -> str:
+    """Keep the start and end of a long text, eliding the middle"""
+    if len(text) <= head + tail + 32:
+        return text
+    return text[:head] + "\n...[truncated]...\n" + text[-tail:]
+
+
+def _append_user_mention(text: str) -> str:
+    """text ending in @user: trailing whitespace trimmed and " @user" added unless already there"""
+    # Find the end of the text once, so the only copy made is the returned string
+    tail_start = len(text)
+    while tail_start > 0 and text[tail_start - 1].isspace():
+        tail_start -= 1
+    if text.endswith("@user", 0, tail_start):
+        return text
+    return text[:tail_start] + " @user"
+
+
+def _mentions_are_tokens(text: str) -> bool:
+    """
+    True if every @name in text starts a token.
+
+    An '@' inside a word (an email address, code like obj@matrix) also matches
+    MENTION_PATTERN but is not a mention; text containing one must not be
+    rewritten mechanically.
+    """
+    return all(
+        m.start() == 0 or text[m.start() - 1].isspace()
+        for m in MENTION_PATTERN.finditer(text)
+    )
+
+
+def _keep_only_mention(text: str, target: Optional[str]) -> str:
+    """
+    Leave exactly one routable @mention in text.
+
+    The last @target is kept; every other @name that starts a token is turned
+    into plain text by dropping its '@'. With target=None all mentions are
+    dropped. An '@' inside a word is never touched.
+    """
+    matches = [
+        m for m in MENTION_PATTERN.finditer(text)
+        if m.start() == 0 or text[m.start() - 1].isspace()
+    ]
+    keep = next((m.start() for m in reversed(matches) if m.group(1) == target), None)
+    parts: List[str] = []
+    pos = 0
+    for m in matches:
+        if m.start() != keep:
+            parts.append(text[pos:m.start()])
+            parts.append(m.group(1))
+            pos = m.end()
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+# Fixed pieces of the capabilities summary
+_SUMMARY_SEPARATOR = " | "
+_CUSTOM_TOOLS_PREFIX = "Custom tools: "
+_MCP_SERVERS_PREFIX = "MCP servers: "
+_NO_CUSTOM_TOOLS = "Custom tools: none"
+_MEMORY_NOTE = "Conversation Memory: enabled via session_store"
+_MCP_CALL_INSTRUCTIONS = (
+    '\nTo call MCP tools: {"action":"call_mcp","server":"<server>","tool":"<tool>","params":{...}}\n'
+    "⚡ Parameters marked with * are REQUIRED - extract them from user's request.\n"
+    "Example: 'navigate to google.com' → params: {\"url\": \"https://google.com\"}\n"
+    "=== END MCP TOOLS ===\n"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_annotation_name(annotation: Any) -> str:
+    return getattr(annotation, "__name__", None) or str(annotation)
+
+
+def _annotation_name(annotation: Any) -> str:
+    """Display name of a parameter annotation, resolved once per annotation"""
+    try:
+        return _cached_annotation_name(annotation)
+    except TypeError:  # unhashable annotation object
+        return getattr(annotation, "__name__", None) or str(annotation)
+
+
+@functools.lru_cache(maxsize=1024)
+def _tool_signature_str(fn: Callable) -> str:
+    """
+    Render a tool as "name(param: type = default, ...)" for the capabilities summary.
+
+    inspect.signature() is slow and tool functions never change once loaded,
+    so each function is rendered once per process.
+    """
+    name = fn.__name__
+    try:
+        sig = inspect.signature(fn)
+        params: List[str] = []
+        for param_name, param in sig.parameters.items():
+            if param.annotation != inspect.Parameter.empty:
+                type_name = _annotation_name(param.annotation)
+                if param.default != inspect.Parameter.empty:
+                    params.append(f"{param_name}: {type_name} = {param.default}")
+                else:
+                    params.append(f"{param_name}: {type_name}")
+            else:
+                params.append(param_name)
+        return f"{name}({', '.join(params)})"
+    except Exception:
+        return name
+
+
+@dataclass(slots=True)
+class Observation:
+    """
+    Outcome of one planner step (tool/MCP result or error, or a reflection).
+
+    `summary` is the "Previous actions" line for this step, rendered once
+    when the observation is created; to_dict() gives the JSON shown to the
+    model as the latest result.
+    """
+    kind: str
+    tool: Optional[str] = None
+    server: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    thought: Optional[str] = None
+    plan: Optional[str] = None
+    evaluation: Optional[str] = None
+    metric: Optional[str] = None
+    should_continue: Optional[bool] = None
+    summary: str = field(init=False, default="")
+
+    def __post_init__(self):
+        self.summary = self._format()
+
+    def _format(self) -> str:
+        kind = self.kind
+        if kind == "tool_result":
+            return f"Tool '{self.tool}' → {_truncated_repr(self.result, 120)}"
+        if kind == "tool_error":
+            return f"Tool '{self.tool}' errored: {self.error or self.result}"
+        if kind == "mcp_result":
+            return f"MCP {self.server}/{self.tool} → {_truncated_repr(self.result, 120)}"
+        if kind == "mcp_error":
+            return f"MCP {self.server}/{self.tool} errored: {self.error or self.result}"
+        if kind == "agent_thought":
+            pieces = [self.thought or ""]
+            if self.plan:
+                pieces.append(f"Plan: {self.plan}")
+            if self.evaluation:
+                pieces.append(f"Evaluation: {self.evaluation}")
+            if self.metric:
+                pieces.append(f"Metric: {self.metric}")
+            if self.should_continue is False:
+                pieces.append("Status: planning complete")
+            elif self.should_continue is True:
+                pieces.append("Status: continuing planning")
+            return " | ".join([p for p in pieces if p])
+        return str(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.kind == "agent_thought":
+            return {
+                "kind": self.kind,
+                "thought": self.thought,
+                "plan": self.plan,
+                "evaluation": self.evaluation,
+                "metric": self.metric,
+                "should_continue": self.should_continue,
+            }
+        payload: Dict[str, Any] = {"kind": self.kind}
+        if self.server is not None:
+            payload["server"] = self.server
+        payload["tool"] = self.tool
+        if self.error is not None:
+            payload["error"] = self.error
+        else:
+            payload["result"] = self.result
+        return payload
+
+
 class BaseAgent:
     """
     Enhanced agent with LangChain LLM integration.
 
     Business Logic (PRESERVED):
     - Agent only uses tools from its tools.py or mcp.json
-    - Four actions: final, call_tool, call_mcp, self_reflect
+    - Five actions: final, call_tool, call_mcp, parallel_calls, self_reflect
     - @mention routing for agent-to-agent communication
     - Group-aware: knows roster, history, descriptions
     - Multi-tenant: same agent in multiple groups with separate history
@@ -56,6 +480,16 @@ class BaseAgent:
         self.tools: Dict[str, Callable[..., Any]] = {}
         self.mcp = None
         self.llm_config = llm_config or {"provider": "openai", "model": "gpt-4o-mini"}
+        # Rendered tool signatures, and the last capabilities summary keyed by
+        # the state it was built from (see get_capabilities_summary)
+        self._tool_signatures: Dict[str, str] = {}
+        self._tools_version = 0
+        self._capabilities_cache: Optional[tuple] = None
+        self._system_prompt_cache: Optional[tuple] = None
+        # "<mentioner>: ... @<agent_id>" in prompts forwarded by other agents
+        self._mentioned_by_pattern = re.compile(r"(\w+):\s*.*@" + re.escape(agent_id))
+        # (tool, sorted JSON args) -> (expiry, result) for @agent_tool_cached tools
+        self._tool_result_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, Any]]" = OrderedDict()
 
     def load_metadata(self, name: str, description: str, folder_path: str) -> None:
         """Load agent metadata"""
@@ -64,37 +498,159 @@ class BaseAgent:
     def attach_mcp(self, mcp_client: Any) -> None:
         """Attach MCP client for external tools"""
         self.mcp = mcp_client
+        self._tools_version += 1  # cached summaries/prompts describe the old client
+
+    async def _run_tool_step(self, group_id: str, tool: Optional[str], kwargs: Dict[str, Any]) -> Observation:
+        """Run one planner tool call and return its observation"""
+        if tool not in self.tools:
+            return Observation(
+                kind="tool_error",
+                tool=tool,
+                result=f"Tool '{tool}' not found. Available tools: {list(self.tools.keys())}",
+            )
+
+        result = await self.call_tool(group_id, tool, **kwargs)
+        return Observation(kind="tool_result", tool=tool, result=result)
+
+    async def _run_mcp_step(
+        self, group_id: str, server: Optional[str], tool: Optional[str], params: Dict[str, Any]
+    ) -> Observation:
+        """Run one planner MCP call (persisting and emitting it) and return its observation"""
+        if not self.mcp:
+            return Observation(kind="mcp_error", server="unknown", tool="unknown", result="MCP not attached to this agent")
+
+        if not server or not tool:
+            return Observation(kind="mcp_error", server=server, tool=tool, result="Missing server or tool name")
+
+        start_time = time.time()
+        # Persisted together with the outcome, in one transaction off the event
+        # loop; a call that never returns leaves no mcp_call row (only the
+        # "calling" event below shows it)
+        call_message = {
+            "sender": self.agent_id,
+            "role": "mcp_call",
+            "content": "🔧 MCP call: "
+            + f"{server}/{tool}\nargs: "
+            + _json_preview(params, 1000),
+            "metadata": {"server": server, "tool": tool, "params": params},
+        }
+
+        await emit_mcp_call(group_id, self.agent_id, server, tool, "calling", {"params": params})
+
+        try:
+            result = await self.mcp.invoke(group_id, self.agent_id, server, tool, **params)
+        except Exception as me:
+            duration_ms = (time.time() - start_time) * 1000
+            err_obj = {
+                "isError": True,
+                "server": server,
+                "tool": tool,
+                "error": str(me),
+                "error_type": type(me).__name__,
+            }
+            obs = Observation(kind="mcp_error", server=server, tool=tool, error=str(me))
+            await asyncio.to_thread(
+                session_store.append_messages,
+                group_id,
+                [
+                    call_message,
+                    {
+                        "sender": self.agent_id,
+                        "role": "mcp_error",
+                        "content": f"❌ MCP error: {server}/{tool}\nerror: {str(me)}",
+                        "metadata": err_obj,
+                    },
+                ],
+            )
+
+            await emit_error(
+                group_id,
+                f"mcp_call:{server}/{tool}",
+                str(me),
+                {"agent_id": self.agent_id, "duration_ms": duration_ms},
+            )
+        else:
+            duration_ms = (time.time() - start_time) * 1000
+            obs = Observation(kind="mcp_result", server=server, tool=tool, result=result)
+
+            # The call succeeded: a failure to record it is logged, not turned
+            # into an MCP error (which would persist the call a second time)
+            outcomes = await asyncio.gather(
+                asyncio.to_thread(
+                    session_store.append_messages,
+                    group_id,
+                    [
+                        call_message,
+                        {
+                            "sender": self.agent_id,
+                            "role": "mcp_result",
+                            "content": "✅ MCP result: "
+                            + f"{server}/{tool}\nresult: "
+                            + _json_preview(result, 2000),
+                            "metadata": {"server": server, "tool": tool, "result": result},
+                        },
+                    ],
+                ),
+                emit_mcp_call(
+                    group_id,
+                    self.agent_id,
+                    server,
+                    tool,
+                    "success",
+                    {"duration_ms": duration_ms, "result_preview": _truncated_repr(result, 200)},
+                ),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    logger.error("Recording MCP call %s/%s for %s failed", server, tool, self.agent_id, exc_info=outcome)
+
+        return obs
+
+    def _mcp_fingerprint(self) -> tuple:
+        """
+        Cheap identity of the attached MCP servers and their discovered tools.
+
+        Built from the version stamp each server takes on every tools/list,
+        never from id() of the tool lists (CPython reuses freed ids).
+        """
+        servers = getattr(self.mcp, "servers", None)
+        if not servers:
+            return ()
+        return tuple((name, handle._tools_version) for name, handle in servers.items())
 
     def get_capabilities_summary(self) -> str:
-        """Return a summary of this agent's capabilities"""
-        parts: List[str] = []
+        """
+        Return a summary of this agent's capabilities.
+
+        Called on every respond(); the summary is rebuilt only when the tools,
+        the description or the MCP servers' tool lists change.
+        """
+        cache_key = (
+            self._tools_version,
+            len(self.tools),
+            self.metadata.get("description"),
+            self._mcp_fingerprint(),
+        )
+        if self._capabilities_cache is not None and self._capabilities_cache[0] == cache_key:
+            return self._capabilities_cache[1]
 
+        # One flat list joined once: the custom tool and MCP server entries use
+        # the same " | " separator as the sections, so they are appended
+        # directly with the section prefix on their first entry
         specialty = self.metadata.get("description", "General purpose agent")
-        parts.append(f"Specialty: {specialty}")
+        parts: List[str] = [f"Specialty: {specialty}"]
 
         # Custom tools
         if self.tools:
-            tool_details: List[str] = []
-            for name, func in self.tools.items():
-                try:
-                    sig = inspect.signature(func)
-                    params: List[str] = []
-                    for param_name, param in sig.parameters.items():
-                        if param.annotation != inspect.Parameter.empty:
-                            type_name = getattr(param.annotation, "__name__", str(param.annotation))
-                            if param.default != inspect.Parameter.empty:
-                                params.append(f"{param_name}: {type_name} = {param.default}")
-                            else:
-                                params.append(f"{param_name}: {type_name}")
-                        else:
-                            params.append(param_name)
-                    signature = f"{name}({', '.join(params)})"
-                    tool_details.append(signature)
-                except Exception:
-                    tool_details.append(name)
-            parts.append(f"Custom tools: {' | '.join(tool_details)}")
+            tool_details = [
+                self._tool_signatures.get(name) or _tool_signature_str(func)
+                for name, func in self.tools.items()
+            ]
+            tool_details[0] = _CUSTOM_TOOLS_PREFIX + tool_details[0]
+            parts.extend(tool_details)
         else:
-            parts.append("Custom tools: none")
+            parts.append(_NO_CUSTOM_TOOLS)
 
         # MCP servers
         if self.mcp is None:
@@ -104,33 +660,43 @@ class BaseAgent:
         elif not self.mcp.servers:
             parts.append("MCP servers: none (empty servers dict)")
         else:
-            mcp_summary: List[str] = []
+            prefix = _MCP_SERVERS_PREFIX
             for server_name, server_handle in self.mcp.servers.items():
-                tool_count = len(server_handle._tools_cache)
-                if tool_count > 0:
-                    tool_names = [tool.name for tool in server_handle._tools_cache[:3]]
-                    if tool_count > 3:
-                        tool_names.append(f"...+{tool_count-3} more")
-                    mcp_summary.append(f"{server_name}({tool_count} tools: {', '.join(tool_names)})")
+                tools_cache = server_handle._tools_cache
+                tool_count = len(tools_cache)
+                if tool_count > 3:
+                    parts.append(
+                        f"{prefix}{server_name}({tool_count} tools: "
+                        f"{tools_cache[0].name}, {tools_cache[1].name}, {tools_cache[2].name}, "
+                        f"...+{tool_count - 3} more)"
+                    )
+                elif tool_count > 0:
+                    tool_names = ", ".join([tool.name for tool in tools_cache])
+                    parts.append(f"{prefix}{server_name}({tool_count} tools: {tool_names})")
                 else:
-                    mcp_summary.append(f"{server_name}(0 tools)")
-            parts.append(f"MCP servers: {' | '.join(mcp_summary)}")
+                    parts.append(f"{prefix}{server_name}(0 tools)")
+                prefix = ""
 
-        parts.append("Conversation Memory: enabled via session_store")
+        parts.append(_MEMORY_NOTE)
 
-        return " | ".join(parts)
+        summary = _SUMMARY_SEPARATOR.join(parts)
+        self._capabilities_cache = (cache_key, summary)
+        return summary
 
     def register_tools_from_module(self, mod: Any) -> None:
         """Register tools from module - only @agent_tool decorator"""
-        for _, fn in inspect.getmembers(mod, inspect.isfunction):
-            if getattr(fn, "__agent_tool__", False):
-                self.tools[fn.__name__] = fn
+        # Walk the module dict directly; getmembers() getattr()s and sorts every name
+        for fn in list(vars(mod).values()):
+            if inspect.isfunction(fn) and getattr(fn, "__agent_tool__", False):
+                name = fn.__name__
+                self.tools[name] = fn
+                self._tool_signatures[name] = _tool_signature_str(fn)
+        self._tools_version += 1
+        self._tool_result_cache.clear()  # results of replaced tools must not be reused
 
     async def call_tool(self, group_id: str, tool_name: str, **kwargs: Any) -> Any:
         """Call a custom tool with logging and error handling"""
         if tool_name not in self.tools:
-            from src.core.memory import session_store
-
             session_store.append_message(
                 group_id=group_id,
                 sender=self.agent_id,
@@ -140,93 +706,133 @@ class BaseAgent:
             )
             return {"isError": True, "tool": tool_name, "error": "Unknown tool", "error_type": "UnknownTool"}
 
-        from src.core.telemetry.session_logger import session_logger
-        from src.core.telemetry.events import emit_tool_call, emit_tool_result, emit_error
-        from src.core.memory import session_store
-        import time
+        tool_fn = self.tools[tool_name]
+        ttl = getattr(tool_fn, "__cacheable__", None)
+        cache_key: Optional[Tuple[str, bytes]] = None
+        if ttl:
+            try:
+                cache_key = (tool_name, orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS | _ORJSON_OPTIONS))
+            except TypeError:
+                pass  # arguments without a stable JSON form are never cached
 
         start_time = time.time()
 
-        try:
-            session_store.append_message(
-                group_id=group_id,
-                sender=self.agent_id,
-                role="tool_call",
-                content="🔧 Tool call: "
+        # The call and its outcome are persisted together once the tool has
+        # finished, in one transaction off the event loop. Trade-off: a tool
+        # that hangs or takes the process down leaves no tool_call row
+        pending_messages: List[Dict[str, Any]] = [
+            {
+                "sender": self.agent_id,
+                "role": "tool_call",
+                "content": "🔧 Tool call: "
                 + f"{tool_name}\nargs: "
-                + json.dumps(kwargs, ensure_ascii=False, default=str)[:1000],
-                metadata={"tool": tool_name, "params": kwargs},
-            )
-            res = self.tools[tool_name](**kwargs)
-            if inspect.isawaitable(res):
-                res = await res
+                + _json_preview(kwargs, 1000),
+                "metadata": {"tool": tool_name, "params": kwargs},
+            }
+        ]
+
+        try:
+            cached = self._tool_result_cache.get(cache_key) if cache_key is not None else None
+            cache_hit = cached is not None and cached[0] > time.monotonic()
+            if cache_hit:
+                self._tool_result_cache.move_to_end(cache_key)
+                res = cached[1]
+            else:
+                res = tool_fn(**kwargs)
+                if inspect.isawaitable(res):
+                    res = await res
+                if cache_key is not None:
+                    self._tool_result_cache[cache_key] = (time.monotonic() + ttl, res)
+                    self._tool_result_cache.move_to_end(cache_key)
+                    if len(self._tool_result_cache) > _TOOL_RESULT_CACHE_SIZE:
+                        self._tool_result_cache.popitem(last=False)
 
+        except Exception as e:
             duration_ms = (time.time() - start_time) * 1000
 
-            session_logger.log_tool_call(
-                session_id=group_id,
-                agent_id=self.agent_id,
-                tool_name=tool_name,
-                params=kwargs,
-                duration_ms=duration_ms,
-                result=res,
+            await asyncio.gather(
+                emit_error(
+                    group_id,
+                    f"tool_call:{tool_name}",
+                    str(e),
+                    {"agent_id": self.agent_id, "duration_ms": duration_ms},
+                ),
+                asyncio.to_thread(
+                    session_logger.log_tool_call,
+                    session_id=group_id,
+                    agent_id=self.agent_id,
+                    tool_name=tool_name,
+                    params=kwargs,
+                    duration_ms=duration_ms,
+                    error=str(e),
+                ),
+                asyncio.to_thread(
+                    session_store.append_messages,
+                    group_id,
+                    pending_messages + [
+                        {
+                            "sender": self.agent_id,
+                            "role": "tool_error",
+                            "content": f"❌ Tool error: {tool_name}\nerror: {str(e)}",
+                            "metadata": {"tool": tool_name, "error": str(e), "error_type": type(e).__name__},
+                        }
+                    ],
+                ),
             )
 
-            await emit_tool_call(
+            return {"isError": True, "tool": tool_name, "error": str(e), "error_type": type(e).__name__}
+
+        duration_ms = (time.time() - start_time) * 1000
+
+        # Independent side effects: run the log/DB writes in worker threads
+        # alongside the UI events instead of one after another. They happen
+        # after the tool succeeded, so a failure here is logged rather than
+        # reported (and persisted a second time) as a tool error
+        outcomes = await asyncio.gather(
+            emit_tool_call(
                 group_id,
                 self.agent_id,
                 tool_name,
                 "success",
-                {"duration_ms": duration_ms, "params": kwargs},
-            )
-            await emit_tool_result(
+                {"duration_ms": duration_ms, "params": kwargs, "cached": cache_hit},
+            ),
+            emit_tool_result(
                 group_id,
                 self.agent_id,
                 tool_name,
-                str(res)[:100],
+                _truncated_repr(res, 100),
                 {"duration_ms": duration_ms},
-            )
-
-            session_store.append_message(
-                group_id=group_id,
-                sender=self.agent_id,
-                role="tool_result",
-                content="✅ Tool result: "
-                + f"{tool_name}\nresult: "
-                + json.dumps(res, ensure_ascii=False, default=str)[:2000],
-                metadata={"tool": tool_name, "result": res},
-            )
-
-            return res
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-
-            session_logger.log_tool_call(
+            ),
+            asyncio.to_thread(
+                session_logger.log_tool_call,
                 session_id=group_id,
                 agent_id=self.agent_id,
                 tool_name=tool_name,
                 params=kwargs,
                 duration_ms=duration_ms,
-                error=str(e),
-            )
-
-            await emit_error(
+                result=res,
+            ),
+            asyncio.to_thread(
+                session_store.append_messages,
                 group_id,
-                f"tool_call:{tool_name}",
-                str(e),
-                {"agent_id": self.agent_id, "duration_ms": duration_ms},
-            )
-
-            session_store.append_message(
-                group_id=group_id,
-                sender=self.agent_id,
-                role="tool_error",
-                content=f"❌ Tool error: {tool_name}\nerror: {str(e)}",
-                metadata={"tool": tool_name, "error": str(e), "error_type": type(e).__name__},
-            )
+                pending_messages + [
+                    {
+                        "sender": self.agent_id,
+                        "role": "tool_result",
+                        "content": "✅ Tool result: "
+                        + f"{tool_name}\nresult: "
+                        + _json_preview(res, 2000),
+                        "metadata": {"tool": tool_name, "result": res},
+                    }
+                ],
+            ),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error("Recording tool call %s for %s failed", tool_name, self.agent_id, exc_info=outcome)
 
-            return {"isError": True, "tool": tool_name, "error": str(e), "error_type": type(e).__name__}
+        return res
 
     def list_mcp_tools(self) -> List[Dict[str, Any]]:
         """List all available MCP tools"""
@@ -234,6 +840,101 @@ class BaseAgent:
             return []
         return self.mcp.list_all_tools()
 
+    def _build_mcp_tools_detail(self) -> str:
+        """Render the MCP tools listing (with parameters) for the system prompt"""
+        return "".join([
+            "\n=== MCP TOOLS AVAILABLE TO YOU ===\n",
+            *(
+                server_handle.rendered_detail()
+                for server_handle in self.mcp.servers.values()
+                if server_handle._tools_cache
+            ),
+            _MCP_CALL_INSTRUCTIONS,
+        ])
+
+    def _system_prompt_parts(self, roster_lines: str) -> Tuple[str, str]:
+        """
+        Return the (head, tail) of the system prompt around the history context.
+
+        Both parts only depend on the agent, its tools/MCP servers and the group
+        roster, so they are rebuilt only when one of those changes; respond()
+        inserts the per-turn history between them.
+        """
+        capabilities = self.get_capabilities_summary()
+        cache_key = (
+            capabilities,
+            self._tools_version,
+            self._mcp_fingerprint(),
+            roster_lines,
+            self.metadata.get("name"),
+        )
+        if self._system_prompt_cache is not None and self._system_prompt_cache[0] == cache_key:
+            return self._system_prompt_cache[1]
+
+        mcp_tools_detail = self._build_mcp_tools_detail() if self.mcp and self.mcp.servers else ""
+
+        head = (
+            f"Agent: {self.agent_id} ({self.metadata.get('name')})\n"
+            f"Specialty: {self.metadata.get('description', 'General purpose')}\n"
+            f"CAPABILITIES: {capabilities}\n"
+            f"{mcp_tools_detail}"
+            f"Group: {roster_lines}\n"
+        )
+        tail = (
+            f"{get_response_schema()}\n"
+            f"RULES AND GUIDELINES:\n"
+            f"- DEFAULT to 'final' action for all normal conversation and responses\n"
+            f"- Use 'call_tool' only for your registered tools; if another agent has the tool, use 'final' and delegate\n"
+            f"- Use 'call_mcp' only for MCP server operations explicitly requested\n"
+            f"- Use 'parallel_calls' only for calls that don't depend on each other's results\n"
+            f"- 🧠 SELF-REFLECTION:\n"
+            f"  • Reflect only when the task requires planning or multi-step coordination\n"
+            f"  • A reflection without new insight is wasteful—move to 'final' instead\n"
+            f"  • After reflecting, either act (tool/MCP) with the updated plan or produce the 'final' answer\n"
+            f"  • Never loop on identical reflections; the system will terminate them\n"
+            f"- 🤖 COLLABORATION STRATEGY:\n"
+            f"  • PREFER agent-to-agent collaboration over returning to user\n"
+            f"  • Only interact with agents listed in Group section above\n"
+            f"  • Delegate appropriately based on agent specialties\n"
+            f"- 🎯 MENTION RULES:\n"
+            f"  • ALWAYS end responses with exactly ONE @mention\n"
+            f"  • If USER mentioned you: respond to @user\n"
+            f"  • If AGENT mentioned you: respond to that @agent (see context above)\n"
+            f"  • If asking another agent for help: mention that @agent\n"
+            f"  • Single-agent groups: always mention @user\n"
+            f"  • Continue workflows collaboratively rather than breaking to user\n"
+            f"- 🎯 MANDATORY @MENTION RULES:\n"
+            f"  • EVERY 'final' response MUST include exactly ONE @mention\n"
+            f"  • @user: when conversation complete, user input needed, or errors need attention\n"
+            f"  • @agent_name: when delegating, collaborating, or continuing workflows\n"
+            f"  • Think: 'Can another agent help?' before defaulting to @user\n"
+            f"  • Only mention agents listed in Group section\n"
+            f"- When tagged by another agent (@{self.agent_id}), engage collaboratively\n"
+            f"- Use structured JSON responses only - system will handle parsing reliably\n"
+            f"- Call tools ONE AT A TIME when a step needs an earlier step's result; "
+            f"use 'parallel_calls' only for calls that are independent of each other"
+        )
+
+        self._system_prompt_cache = (cache_key, (head, tail))
+        return head, tail
+
+    def _get_llm(self):
+        """LLM client for this agent's config, shared across turns via get_cached_llm"""
+        return get_cached_llm(self.llm_config.get("provider"), self.llm_config.get("model"))
+
+    def _get_corrector_llm(self):
+        """
+        LLM client for validation-wall rewrites.
+
+        Adding or dropping one @mention is a small edit, so an agent can name a
+        cheaper model for it with `corrector_model` in its llm config (same
+        provider); without one the agent's own model is used.
+        """
+        corrector_model = self.llm_config.get("corrector_model")
+        if not corrector_model:
+            return self._get_llm()
+        return get_cached_llm(self.llm_config.get("provider"), corrector_model)
+
     async def respond(self, prompt: str, group_id: str, orchestrator: Any = None, depth: int = 2) -> Dict[str, Any]:
         """Entry-point for agent responses with structured metadata."""
         return await self._respond_inner(prompt, group_id, orchestrator, depth)
@@ -242,29 +943,41 @@ class BaseAgent:
         """
         Multi-step planner loop with LangChain LLM.
 
-        Supports four actions:
+        Supports five actions:
         - final: return a response to the user (must include @mention)
         - call_tool: invoke a local tool from tools.py
         - call_mcp: invoke an MCP tool
+        - parallel_calls: run several independent tool/MCP calls concurrently
         - self_reflect: internal planning/thinking step
         """
-        llm = get_llm(
-            provider=self.llm_config.get("provider"),
-            model=self.llm_config.get("model"),
-        )
+        llm = self._get_llm()
 
         roster = []
+        roster_lines = "- (no other members)"
         if orchestrator:
             roster = orchestrator.group_roster(group_id)
-        roster_lines = "\n".join([f"- @{k} — {n}: {d}" for (k, n, d) in roster]) or "- (no other members)"
+            if roster:
+                roster_lines = "\n".join([f"- @{k} — {n}: {d}" for (k, n, d) in roster])
 
-        from src.core.memory import session_store
+        # Rendered history and the session_store version it was built from;
+        # planner steps that added no messages reuse it as-is
+        history_cache: List[Any] = [None, ""]
 
         def build_history_context() -> str:
-            hist = session_store.get_history(group_id) if group_id else []
-            if not hist:
+            if not group_id:
+                return ""
+            version = session_store.get_history_version(group_id)
+            if history_cache[0] == version:
+                return history_cache[1]
+            history_cache[0] = version
+            history_cache[1] = render_history_context()
+            return history_cache[1]
+
+        def render_history_context() -> str:
+            # In-memory tail of the group's messages, kept current by append_message()
+            recent = session_store.get_history_tail(group_id, MAX_CONVERSATION_HISTORY)
+            if not recent:
                 return ""
-            recent = hist[-MAX_CONVERSATION_HISTORY:]
             lines: List[str] = []
             last_user_message = ""
 
@@ -290,10 +1003,7 @@ class BaseAgent:
             if last_user_message and f"@{self.agent_id}" in last_user_message:
                 context_note = f"\n📍 IMPORTANT: You ({self.agent_id}) are being directly addressed by the user.\n"
             elif prompt and f"@{self.agent_id}" in prompt:
-                import re
-
-                mention_pattern = r"(\w+):\s*.*@" + re.escape(self.agent_id)
-                mention_match = re.search(mention_pattern, prompt)
+                mention_match = self._mentioned_by_pattern.search(prompt)
                 if mention_match:
                     mentioner = mention_match.group(1)
                     context_note = f"\n📍 IMPORTANT: You ({self.agent_id}) are being mentioned by {mentioner}.\n"
@@ -307,128 +1017,40 @@ class BaseAgent:
 
         history_context = build_history_context()
 
-        # Build MCP tools listing
-        mcp_tools_detail = ""
-        if self.mcp and self.mcp.servers:
-            mcp_tools_detail = "\n=== MCP TOOLS AVAILABLE TO YOU ===\n"
-            for server_name, server_handle in self.mcp.servers.items():
-                if server_handle._tools_cache:
-                    mcp_tools_detail += f"Server: {server_name}\n"
-                    for tool in server_handle._tools_cache:
-                        desc = tool.description[:100] + "..." if len(tool.description) > 100 else tool.description
-
-                        params = tool.parameters.get("properties", {})
-                        required_params = tool.parameters.get("required", [])
-
-                        param_info: List[str] = []
-                        for param_name, param_def in params.items():
-                            param_desc = param_def.get("description", "")[:50]
-                            if len(param_desc) > 47:
-                                param_desc = param_desc[:47] + "..."
-
-                            if param_name in required_params:
-                                param_info.append(f"{param_name}* ({param_desc})")
-                            else:
-                                param_info.append(f"{param_name} ({param_desc})")
-
-                        param_str = ", ".join(param_info) if param_info else "none"
-                        mcp_tools_detail += f"  - {tool.name}: {desc}\n"
-                        mcp_tools_detail += f"    Params: {param_str}\n"
-                    mcp_tools_detail += "\n"
-            mcp_tools_detail += '\nTo call MCP tools: {"action":"call_mcp","server":"<server>","tool":"<tool>","params":{...}}\n'
-            mcp_tools_detail += "⚡ Parameters marked with * are REQUIRED - extract them from user's request.\n"
-            mcp_tools_detail += "Example: 'navigate to google.com' → params: {\"url\": \"https://google.com\"}\n"
-            mcp_tools_detail += "=== END MCP TOOLS ===\n"
-
-        response_schema = get_response_schema()
-
-        sys = (
-            f"Agent: {self.agent_id} ({self.metadata.get('name')})\n"
-            f"Specialty: {self.metadata.get('description', 'General purpose')}\n"
-            f"CAPABILITIES: {self.get_capabilities_summary()}\n"
-            f"{mcp_tools_detail}"
-            f"Group: {roster_lines}\n"
-            f"{history_context}"
-            f"{response_schema}\n"
-            f"RULES AND GUIDELINES:\n"
-            f"- DEFAULT to 'final' action for all normal conversation and responses\n"
-            f"- Use 'call_tool' only for your registered tools; if another agent has the tool, use 'final' and delegate\n"
-            f"- Use 'call_mcp' only for MCP server operations explicitly requested\n"
-            f"- 🧠 SELF-REFLECTION:\n"
-            f"  • Reflect only when the task requires planning or multi-step coordination\n"
-            f"  • A reflection without new insight is wasteful—move to 'final' instead\n"
-            f"  • After reflecting, either act (tool/MCP) with the updated plan or produce the 'final' answer\n"
-            f"  • Never loop on identical reflections; the system will terminate them\n"
-            f"- 🤖 COLLABORATION STRATEGY:\n"
-            f"  • PREFER agent-to-agent collaboration over returning to user\n"
-            f"  • Only interact with agents listed in Group section above\n"
-            f"  • Delegate appropriately based on agent specialties\n"
-            f"- 🎯 MENTION RULES:\n"
-            f"  • ALWAYS end responses with exactly ONE @mention\n"
-            f"  • If USER mentioned you: respond to @user\n"
-            f"  • If AGENT mentioned you: respond to that @agent (see context above)\n"
-            f"  • If asking another agent for help: mention that @agent\n"
-            f"  • Single-agent groups: always mention @user\n"
-            f"  • Continue workflows collaboratively rather than breaking to user\n"
-            f"- 🎯 MANDATORY @MENTION RULES:\n"
-            f"  • EVERY 'final' response MUST include exactly ONE @mention\n"
-            f"  • @user: when conversation complete, user input needed, or errors need attention\n"
-            f"  • @agent_name: when delegating, collaborating, or continuing workflows\n"
-            f"  • Think: 'Can another agent help?' before defaulting to @user\n"
-            f"  • Only mention agents listed in Group section\n"
-            f"- When tagged by another agent (@{self.agent_id}), engage collaboratively\n"
-            f"- Use structured JSON responses only - system will handle parsing reliably\n"
-            f"- Call tools ONE AT A TIME for multi-step operations"
-        )
+        sys_head, sys_tail = self._system_prompt_parts(roster_lines)
+        sys = sys_head + history_context + sys_tail
+        # The head is identical for every turn of this agent and group; marking
+        # it lets providers serve it from their prompt cache on each decide()
+        system_message = llm.system_message(sys_head, history_context + sys_tail)
 
-        observations: List[Dict[str, Any]] = []
-        last_reflection_signature: Optional[str] = None
+        observations: List[Observation] = []
+        last_reflection_signature: Optional[bytes] = None
         must_finalize = False
 
-        def format_observation(observation: Dict[str, Any]) -> str:
-            kind = observation.get("kind")
-
-            if kind == "tool_result":
-                preview = str(observation.get("result"))[:120]
-                return f"Tool '{observation.get('tool')}' → {preview}"
-            if kind == "tool_error":
-                return f"Tool '{observation.get('tool')}' errored: {observation.get('result')}"
-            if kind == "mcp_result":
-                preview = str(observation.get("result"))[:120]
-                return f"MCP {observation.get('server')}/{observation.get('tool')} → {preview}"
-            if kind == "mcp_error":
-                error_msg = observation.get("error") or observation.get("result")
-                return f"MCP {observation.get('server')}/{observation.get('tool')} errored: {error_msg}"
-            if kind == "agent_thought":
-                pieces = [observation.get("thought") or ""]
-                if observation.get("plan"):
-                    pieces.append(f"Plan: {observation['plan']}")
-                if observation.get("evaluation"):
-                    pieces.append(f"Evaluation: {observation['evaluation']}")
-                if observation.get("metric"):
-                    pieces.append(f"Metric: {observation['metric']}")
-                status = observation.get("should_continue")
-                if status is False:
-                    pieces.append("Status: planning complete")
-                elif status is True:
-                    pieces.append("Status: continuing planning")
-                return " | ".join([p for p in pieces if p])
-            return str(observation)
-
-        def summarize_observations(latest_obs: Dict[str, Any], enforce_final: bool = False) -> str:
+        # Numbered "Previous actions" lines, built once per observation
+        # rather than re-rendered for every planner step
+        observation_lines: List[str] = []
+
+        def summarize_observations(latest_obs: Observation | List[Observation], enforce_final: bool = False) -> str:
+            for obs in observations[len(observation_lines):]:
+                observation_lines.append(f"{len(observation_lines) + 1}. {obs.summary}\n")
+
             history_ctx = build_history_context()
-            summary = f"Original user request: {prompt}\n\n"
+            parts = [f"Original user request: {prompt}\n\n"]
             if history_ctx.strip():
-                summary += history_ctx + "\n"
+                parts.append(history_ctx + "\n")
 
-            summary += "Previous actions taken:\n"
-            if observations:
-                for i, obs in enumerate(observations, 1):
-                    summary += f"{i}. {format_observation(obs)}\n"
+            parts.append("Previous actions taken:\n")
+            if observation_lines:
+                parts.extend(observation_lines)
             else:
-                summary += "• None so far\n"
+                parts.append("• None so far\n")
 
-            summary += f"\nLatest result: {json.dumps(latest_obs, ensure_ascii=False)}\n\n"
+            if isinstance(latest_obs, list):
+                latest_payload = _json_str([obs.to_dict() for obs in latest_obs])
+            else:
+                latest_payload = _json_str(latest_obs.to_dict())
+            parts.append(f"\nLatest result: {latest_payload}\n\n")
             guidance = (
                 "Evaluate progress toward the goal. Decide whether to call a tool, call an MCP tool, "
                 "take a brief self_reflect planning step, or produce the final answer. Only use tools when necessary."
@@ -437,12 +1059,12 @@ class BaseAgent:
                 guidance += " STOP PLANNING NOW: respond with {\"action\":\"final\", ...}. Do NOT output self_reflect again."
             else:
                 guidance += " Reserve self_reflect for focused planning adjustments when new insights appear."
-            summary += guidance
-            return summary
+            parts.append(guidance)
+            return "".join(parts)
 
         async def decide(user_or_obs: str) -> Dict[str, Any]:
             """Make decision using LangChain LLM"""
-            raw = await llm.simple_chat(system=sys, user=user_or_obs)
+            raw = await _stream_decision(llm, system_message, user_or_obs)
 
             try:
                 parsed_response = parse_agent_response(raw)
@@ -466,6 +1088,19 @@ class BaseAgent:
                         "tool": parsed_response.tool,
                         "params": parsed_response.inputs,
                     }
+                if isinstance(parsed_response, ParallelCallsResponse):
+                    return {
+                        "action": "parallel_calls",
+                        "calls": [
+                            {
+                                "kind": call.kind or ("mcp" if call.server else "tool"),
+                                "server": call.server,
+                                "tool": call.tool,
+                                "params": call.inputs,
+                            }
+                            for call in parsed_response.calls
+                        ],
+                    }
                 if isinstance(parsed_response, SelfReflectResponse):
                     return {
                         "action": "self_reflect",
@@ -485,6 +1120,16 @@ class BaseAgent:
 
         state = await decide(f"User prompt: {prompt}")
 
+        # Most turns are a single direct answer: validate it and return without
+        # entering the planner loop
+        if (state.get("action") or "").lower() == "final":
+            validated_response = await self._validate_and_fix_response(
+                state.get("text", ""), roster, group_id, sys, prompt_head=sys_head
+            )
+            return {
+                "text": validated_response,
+            }
+
         steps = 0
 
         while steps < MAX_PLANNING_STEPS:
@@ -494,19 +1139,19 @@ class BaseAgent:
             if must_finalize and act != "final":
                 forced_state = await decide(
                     "STOP. Planning is complete. Respond with valid JSON where \"action\" is \"final\" and you answer the user. "
-                    "Do NOT return self_reflect, call_tool, or call_mcp."
+                    "Do NOT return self_reflect, call_tool, call_mcp, or parallel_calls."
                 )
                 state = forced_state
                 act = (state.get("action") or "").lower()
 
                 if act != "final":
                     latest_reflection = next(
-                        (obs for obs in reversed(observations) if obs.get("kind") == "agent_thought"),
+                        (obs for obs in reversed(observations) if obs.kind == "agent_thought"),
                         None,
                     )
                     fallback_text = ""
                     if latest_reflection:
-                        fallback_text = latest_reflection.get("plan") or latest_reflection.get("thought") or ""
+                        fallback_text = latest_reflection.plan or latest_reflection.thought or ""
                     fallback_text = fallback_text.strip() or "Continuing with the requested answer."
                     if "@user" not in fallback_text:
                         fallback_text = f"{fallback_text} @user"
@@ -522,120 +1167,51 @@ class BaseAgent:
                 final_response = state.get("text", "")
                 model_payload: FinalResponse | None = state.get("raw_model")
 
-                validated_response = await self._validate_and_fix_response(final_response, roster, group_id, sys)
+                validated_response = await self._validate_and_fix_response(
+                    final_response, roster, group_id, sys, prompt_head=sys_head
+                )
 
                 return {
                     "text": validated_response,
                 }
 
             if act == "call_tool":
-                tool = state.get("tool_name")
-                kwargs = state.get("kwargs", {})
-
-                if tool not in self.tools:
-                    obs = {
-                        "kind": "tool_error",
-                        "tool": tool,
-                        "result": f"Tool '{tool}' not found. Available tools: {list(self.tools.keys())}",
-                    }
-                    observations.append(obs)
-                    state = await decide(summarize_observations(obs, enforce_final=must_finalize))
-                    continue
-
-                result = await self.call_tool(group_id, tool, **kwargs)
-                obs = {"kind": "tool_result", "tool": tool, "result": result}
+                obs = await self._run_tool_step(group_id, state.get("tool_name"), state.get("kwargs", {}))
                 observations.append(obs)
 
                 state = await decide(summarize_observations(obs, enforce_final=must_finalize))
                 continue
 
             if act == "call_mcp":
-                if not self.mcp:
-                    obs = {"kind": "mcp_error", "server": "unknown", "tool": "unknown", "result": "MCP not attached to this agent"}
-                    observations.append(obs)
-                    state = await decide(summarize_observations(obs, enforce_final=must_finalize))
-                    continue
-
-                server = state.get("server")
-                tool = state.get("tool")
-                params = state.get("params", {})
-
-                if not server or not tool:
-                    obs = {"kind": "mcp_error", "server": server, "tool": tool, "result": "Missing server or tool name"}
-                    observations.append(obs)
-                    state = await decide(summarize_observations(obs, enforce_final=must_finalize))
-                    continue
-
-                from src.core.telemetry.events import emit_mcp_call, emit_error
-                import time
-
-                start_time = time.time()
-                session_store.append_message(
-                    group_id,
-                    sender=self.agent_id,
-                    role="mcp_call",
-                    content="🔧 MCP call: "
-                    + f"{server}/{tool}\nargs: "
-                    + json.dumps(params, ensure_ascii=False, default=str)[:1000],
-                    metadata={"server": server, "tool": tool, "params": params},
-                )
-
-                await emit_mcp_call(group_id, self.agent_id, server, tool, "calling", {"params": params})
-
-                try:
-                    result = await self.mcp.invoke(group_id, self.agent_id, server, tool, **params)
-                    duration_ms = (time.time() - start_time) * 1000
-
-                    obs = {"kind": "mcp_result", "server": server, "tool": tool, "result": result}
-                    observations.append(obs)
-
-                    session_store.append_message(
-                        group_id,
-                        sender=self.agent_id,
-                        role="mcp_result",
-                        content="✅ MCP result: "
-                        + f"{server}/{tool}\nresult: "
-                        + json.dumps(result, ensure_ascii=False, default=str)[:2000],
-                        metadata={"server": server, "tool": tool, "result": result},
-                    )
-
-                    await emit_mcp_call(
-                        group_id,
-                        self.agent_id,
-                        server,
-                        tool,
-                        "success",
-                        {"duration_ms": duration_ms, "result_preview": str(result)[:200]},
-                    )
-
-                except Exception as me:
-                    duration_ms = (time.time() - start_time) * 1000
-                    err_obj = {
-                        "isError": True,
-                        "server": server,
-                        "tool": tool,
-                        "error": str(me),
-                        "error_type": type(me).__name__,
-                    }
-                    observations.append({"kind": "mcp_error", "server": server, "tool": tool, "error": str(me)})
-                    session_store.append_message(
-                        group_id,
-                        sender=self.agent_id,
-                        role="mcp_error",
-                        content=f"❌ MCP error: {server}/{tool}\nerror: {str(me)}",
-                        metadata=err_obj,
-                    )
-
-                    await emit_error(
-                        group_id,
-                        f"mcp_call:{server}/{tool}",
-                        str(me),
-                        {"agent_id": self.agent_id, "duration_ms": duration_ms},
-                    )
+                obs = await self._run_mcp_step(group_id, state.get("server"), state.get("tool"), state.get("params", {}))
+                observations.append(obs)
 
                 state = await decide(summarize_observations(obs, enforce_final=must_finalize))
                 continue
 
+            if act == "parallel_calls":
+                # Independent calls: wall time is the slowest call, not the sum
+                semaphore = asyncio.Semaphore(MAX_PARALLEL_CALLS)
+
+                async def run_call(call: Dict[str, Any]) -> Observation:
+                    async with semaphore:
+                        if call["kind"] == "mcp":
+                            return await self._run_mcp_step(group_id, call["server"], call["tool"], call["params"])
+                        return await self._run_tool_step(group_id, call["tool"], call["params"])
+
+                calls = state.get("calls") or []
+                results = await asyncio.gather(*(run_call(call) for call in calls), return_exceptions=True)
+                step_obs: List[Observation] = []
+                for call, result in zip(calls, results):
+                    if isinstance(result, BaseException):
+                        kind = "mcp_error" if call["kind"] == "mcp" else "tool_error"
+                        result = Observation(kind=kind, server=call["server"], tool=call["tool"], error=str(result))
+                    step_obs.append(result)
+                observations.extend(step_obs)
+
+                state = await decide(summarize_observations(step_obs, enforce_final=must_finalize))
+                continue
+
             if act == "self_reflect":
                 reflect_model: SelfReflectResponse | None = state.get("raw_model")
                 thought_text = (reflect_model.thought if reflect_model else None) or state.get("thought") or ""
@@ -655,7 +1231,7 @@ class BaseAgent:
                     "evaluation": evaluation_text or "",
                     "metric": metric_text or "",
                 }
-                signature = json.dumps(signature_payload, sort_keys=True)
+                signature = orjson.dumps(signature_payload, option=orjson.OPT_SORT_KEYS)
                 is_duplicate_reflection = signature == last_reflection_signature
                 last_reflection_signature = signature
 
@@ -706,14 +1282,14 @@ class BaseAgent:
                         },
                     )
 
-                obs = {
-                    "kind": "agent_thought",
-                    "thought": thought_text,
-                    "plan": plan_text,
-                    "evaluation": evaluation_text,
-                    "metric": metric_text,
-                    "should_continue": should_continue,
-                }
+                obs = Observation(
+                    kind="agent_thought",
+                    thought=thought_text,
+                    plan=plan_text,
+                    evaluation=evaluation_text,
+                    metric=metric_text,
+                    should_continue=should_continue,
+                )
                 observations.append(obs)
 
                 state = await decide(summarize_observations(obs, enforce_final=must_finalize))
@@ -729,6 +1305,105 @@ class BaseAgent:
             "metadata": {"reason": "max_steps"},
         }
 
+    async def _race_corrections(
+        self,
+        llm: Any,
+        messages: List[Dict[str, str]],
+        count: int,
+        available_agents: List[str],
+        attempts_before: int = 0,
+    ) -> Tuple[Optional[str], Optional[str], bool, int]:
+        """
+        Request `count` corrections of the same conversation concurrently.
+
+        Returns (first reply with exactly one valid @mention, last invalid
+        reply, stuck, attempts); the remaining requests are cancelled once a
+        valid reply arrives, the wait budget runs out, or the same invalid
+        reply comes back twice (stuck=True: further attempts would repeat it).
+        Attempts are numbered from attempts_before + 1 so a follow-up round
+        continues the count of the one before it; the returned total
+        includes them.
+
+        The budget comes from the smoothed latency of this provider/model.
+        The first reply feeds that latency; a budget that runs out before any
+        reply raises it and starts one hedged attempt with a fresh budget
+        before giving up.
+        """
+        loop = asyncio.get_running_loop()
+        latency_key = (getattr(llm, "provider", None), getattr(llm, "model", None))
+        started = loop.time()
+        budget = _correction_budget(latency_key)
+        deadline = None if budget is None else started + budget
+        attempts = [
+            asyncio.create_task(_stream_single_mention_reply(llm, messages))
+            for _ in range(count)
+        ]
+        invalid_response = None
+        seen_invalid = set()
+        attempt = attempts_before
+        replied = False
+        hedged = False
+        try:
+            pending = set(attempts)
+            while pending:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if not replied:
+                        # Nothing came back in time: the latency estimate was
+                        # too low, so raise it toward what was actually waited
+                        _record_correction_latency(latency_key, loop.time() - started)
+                    if replied or hedged:
+                        logger.warning("Validation wall: corrections for %s timed out", self.agent_id)
+                        break
+                    # Race one fresh request alongside the slow ones
+                    hedged = True
+                    logger.info("Validation wall: corrections for %s are slow, sending a hedged attempt", self.agent_id)
+                    hedge = asyncio.create_task(_stream_single_mention_reply(llm, messages))
+                    attempts.append(hedge)
+                    pending.add(hedge)
+                    deadline = loop.time() + _correction_budget(latency_key)
+                    continue
+
+                for finished in done:
+                    attempt += 1
+                    if finished.exception() is not None:
+                        logger.error(
+                            "Validation wall: error during correction attempt %d",
+                            attempt,
+                            exc_info=finished.exception(),
+                        )
+                        continue
+
+                    corrected_response = finished.result()
+                    if not replied:
+                        replied = True
+                        _record_correction_latency(latency_key, loop.time() - started)
+                    corrected_agent = _sole_mention(corrected_response)
+                    if corrected_agent is not None and corrected_agent in available_agents:
+                        logger.info("Validation wall: response corrected after %d attempts", attempt)
+                        return corrected_response, invalid_response, False, attempt
+
+                    if corrected_response in seen_invalid:
+                        logger.info("Validation wall: %s repeats the same invalid correction, giving up", self.agent_id)
+                        return None, corrected_response, True, attempt
+                    seen_invalid.add(corrected_response)
+                    invalid_response = corrected_response
+                    if logger.isEnabledFor(logging.DEBUG):
+                        if corrected_agent is not None:
+                            logger.debug("Validation wall: attempt %d still invalid (unknown @%s)", attempt, corrected_agent)
+                        else:
+                            logger.debug(
+                                "Validation wall: attempt %d still invalid (%d mentions)",
+                                attempt,
+                                len(MENTION_PATTERN.findall(corrected_response)),
+                            )
+        finally:
+            for task in attempts:
+                task.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+        return None, invalid_response, False, attempt
+
     async def _validate_and_fix_response(
         self,
         response: str,
@@ -736,69 +1411,114 @@ class BaseAgent:
         group_id: str,
         system_prompt: str,
         max_attempts: int = MAX_VALIDATION_ATTEMPTS,
+        prompt_head: Optional[str] = None,
     ) -> str:
-        """Validation wall: Ensures response contains exactly one @mention"""
-        import re
-
-        from src.core.llm.factory import get_llm as get_llm_for_validation
-
-        MENTION_PATTERN = re.compile(r"@([A-Za-z0-9_\-]+)", re.DOTALL)
-        mentions = MENTION_PATTERN.findall(response)
+        """
+        Validation wall: Ensures response contains exactly one @mention
 
+        prompt_head is the static part of system_prompt (see
+        _system_prompt_parts); corrections are cached under it rather than
+        under the full prompt, whose history changes every turn.
+        """
         available_agents = [agent[0] for agent in roster if agent[0] != self.agent_id] + ["user"]
 
-        if len(mentions) == 1:
-            mentioned_agent = mentions[0]
+        # The common case (exactly one valid mention) stops scanning at the second match
+        mentioned_agent = _sole_mention(response)
+        if mentioned_agent is not None:
             if mentioned_agent in available_agents:
                 return response
             mentions = []
+        else:
+            mentions = MENTION_PATTERN.findall(response)
+
+        # Mechanical fixes need no LLM round-trip: a single valid target that is
+        # repeated or mixed with unknown names, or no target when @user is the
+        # only option. They only apply when every '@' is a real mention; text
+        # with emails or code goes to the rewrite loop like ambiguous responses.
+        if _mentions_are_tokens(response):
+            valid_targets = {m for m in mentions if m in available_agents}
+            if len(valid_targets) == 1:
+                logger.debug("Validation wall: keeping the single valid @mention in %s's response", self.agent_id)
+                return _keep_only_mention(response, valid_targets.pop())
+            if not valid_targets and available_agents == ["user"]:
+                logger.debug("Validation wall: addressing %s's response to @user", self.agent_id)
+                return _append_user_mention(_keep_only_mention(response, None))
+
+        options = f"@user, {', '.join(f'@{agent[0]}' for agent in roster)}"
+        if len(mentions) == 0:
+            error_msg = (
+                "⚠️ VALIDATION ERROR: Your response is missing a required @mention.\n"
+                "MANDATORY: Every response must include exactly ONE @mention.\n"
+                f"Available options: {options}\n\n"
+                f"Your original response:\n{response}\n\n"
+                "Please rewrite your response including exactly one appropriate @mention:"
+            )
+        else:
+            error_msg = (
+                f"⚠️ VALIDATION ERROR: Your response has {len(mentions)} @mentions but exactly ONE is required.\n"
+                f"Found mentions: {', '.join(f'@{m}' for m in mentions)}\n"
+                f"Available options: {options}\n\n"
+                f"Your original response:\n{response}\n\n"
+                "Please rewrite your response with exactly one appropriate @mention:"
+            )
 
-        attempt = 0
-        current_response = response
-
-        llm = get_llm_for_validation(
-            provider=self.llm_config.get("provider"),
-            model=self.llm_config.get("model"),
+        # The same failed response in the same context was already corrected:
+        # reuse that rewrite if it still names a current group member
+        cache_key = _correction_cache_key(prompt_head if prompt_head is not None else system_prompt, error_msg)
+        cached = _correction_cache.get(cache_key)
+        if cached is not None and _sole_mention(cached) in available_agents:
+            _correction_cache.move_to_end(cache_key)
+            logger.debug("Validation wall: reusing cached correction for %s", self.agent_id)
+            return cached
+
+        draft_llm = self._get_corrector_llm()
+        logger.info(
+            "Validation wall: requesting %d corrections for missing/multiple @mentions from %s",
+            max_attempts,
+            self.agent_id,
+        )
+        # A stalled provider call must not hold the response: each round waits
+        # at most a multiple of the model's smoothed latency (see _race_corrections)
+
+        # Every attempt sends the same conversation; build it once
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": error_msg},
+        ]
+        corrected_response, invalid_response, stuck, attempts = await self._race_corrections(
+            draft_llm, messages, max_attempts, available_agents
         )
 
-        while attempt < max_attempts:
-            attempt += 1
-            print(f"🔄 Validation wall: Response from {self.agent_id} attempt {attempt} - fixing missing/multiple @mentions")
-
-            if len(mentions) == 0:
-                error_msg = (
-                    "⚠️ VALIDATION ERROR: Your response is missing a required @mention.\n"
-                    "MANDATORY: Every response must include exactly ONE @mention.\n"
-                    f"Available options: @user, {', '.join(f'@{agent[0]}' for agent in roster)}\n\n"
-                    f"Your original response:\n{current_response}\n\n"
-                    "Please rewrite your response including exactly one appropriate @mention:"
-                )
+        if corrected_response is None and invalid_response is not None and not stuck:
+            # One follow-up turn in the same conversation, on the agent's own
+            # model: the unchanged prefix lets providers reuse their prompt
+            # cache for everything but the two new messages
+            invalid_agent = _sole_mention(invalid_response)
+            if invalid_agent is not None:
+                problem = f"@{invalid_agent} is not a member of this group"
             else:
-                error_msg = (
-                    f"⚠️ VALIDATION ERROR: Your response has {len(mentions)} @mentions but exactly ONE is required.\n"
-                    f"Found mentions: {', '.join(f'@{m}' for m in mentions)}\n"
-                    f"Available options: @user, {', '.join(f'@{agent[0]}' for agent in roster)}\n\n"
-                    f"Your original response:\n{current_response}\n\n"
-                    "Please rewrite your response with exactly one appropriate @mention:"
-                )
-
-            try:
-                corrected_response = await llm.simple_chat(system=system_prompt, user=error_msg)
-                corrected_mentions = MENTION_PATTERN.findall(corrected_response)
-
-                if len(corrected_mentions) == 1 and corrected_mentions[0] in available_agents:
-                    print(f"✅ Validation wall: Response corrected after {attempt} attempts")
-                    return corrected_response
-
-                print(f"❌ Validation wall: Attempt {attempt} still invalid ({len(corrected_mentions)} mentions)")
-                current_response = corrected_response
-                mentions = corrected_mentions
+                problem = f"it has {len(MENTION_PATTERN.findall(invalid_response))} @mentions"
+            follow_up = messages + [
+                # Only the mentions matter here; the full text to rewrite is
+                # already in the first user message
+                {"role": "assistant", "content": _truncate_middle(invalid_response)},
+                {
+                    "role": "user",
+                    "content": (
+                        f"⚠️ Still invalid: {problem}. Use exactly ONE of: {options}\n"
+                        "Rewrite the response with exactly one appropriate @mention:"
+                    ),
+                },
+            ]
+            corrected_response, _, _, _ = await self._race_corrections(
+                self._get_llm(), follow_up, 1, available_agents, attempts_before=attempts
+            )
 
-            except Exception as e:
-                print(f"❌ Validation wall: Error during correction attempt {attempt}: {e}")
-                continue
+        if corrected_response is not None:
+            _correction_cache[cache_key] = corrected_response
+            if len(_correction_cache) > _CORRECTION_CACHE_SIZE:
+                _correction_cache.popitem(last=False)
+            return corrected_response
 
-        print("⚠️ Validation wall: Max attempts reached, forcing @user mention")
-        if not response.strip().endswith("@user"):
-            return f"{response.rstrip()} @user"
-        return response
+        logger.warning("Validation wall: max attempts reached, forcing @user mention for %s", self.agent_id)
+        return _append_user_mention(response)
@@ -3,10 +3,21 @@ Agent Response Models
 Lean Pydantic models for structured agent outputs
 """
 
+import json
+import re
 from enum import Enum
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, ValidationError
+
+# Compiled once; checked for every response that is not valid JSON.
+# Agent keys are ASCII, so \w is limited to ASCII (no Unicode category lookups)
+_MENTION_RE = re.compile(r'@\w+', re.ASCII)
+_TRAILING_MENTION_RE = re.compile(r'@\w+\s*$', re.ASCII)
+_JSON_DECODER = json.JSONDecoder()
+# A fenced JSON object preceded by prose ("Sure:\n```json\n{...}\n```")
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
 
 
 class ActionType(str, Enum):
@@ -14,6 +25,7 @@ class ActionType(str, Enum):
     CALL_TOOL = "call_tool"
     CALL_MCP = "call_mcp"
     SELF_REFLECT = "self_reflect"
+    PARALLEL_CALLS = "parallel_calls"
 
 
 class AgentResponse(BaseModel):
@@ -45,6 +57,26 @@ class MCPCallResponse(AgentResponse):
         populate_by_name = True  # Allow both 'inputs' and 'params'
 
 
+class ParallelCall(BaseModel):
+    """One tool or MCP call inside a parallel_calls response"""
+    kind: Optional[Literal["tool", "mcp"]] = Field(
+        None,
+        description="'tool' or 'mcp'; inferred from 'server' when omitted"
+    )
+    server: Optional[str] = Field(None, description="MCP server name (MCP calls only)")
+    tool: str = Field(..., description="Tool name to call")
+    inputs: Dict[str, Any] = Field(default_factory=dict, description="Tool inputs", alias="params")
+
+    class Config:
+        populate_by_name = True  # Allow both 'inputs' and 'params'
+
+
+class ParallelCallsResponse(AgentResponse):
+    """Several independent tool/MCP calls to run concurrently"""
+    action: Literal[ActionType.PARALLEL_CALLS] = ActionType.PARALLEL_CALLS
+    calls: List[ParallelCall] = Field(..., min_length=1, description="Independent calls to run together")
+
+
 class SelfReflectResponse(AgentResponse):
     """Self reflection / planning response"""
     action: Literal[ActionType.SELF_REFLECT] = ActionType.SELF_REFLECT
@@ -67,7 +99,7 @@ class SelfReflectResponse(AgentResponse):
 def get_response_schema() -> str:
     """Get JSON schema for agent responses"""
     return """
-You MUST respond with valid JSON matching one of these 4 schemas:
+You MUST respond with valid JSON matching one of these 5 schemas:
 
 1. Final Response (most common):
 {
@@ -100,29 +132,64 @@ You MUST respond with valid JSON matching one of these 4 schemas:
   "should_continue": true             // Optional; set true ONLY when another external action is required
 }
 
+5. Parallel Calls (several INDEPENDENT tool/MCP calls at once; none may need another's result):
+{
+  "action": "parallel_calls",
+  "calls": [
+    {"kind": "tool", "tool": "tool_name", "inputs": {"param": "value"}},
+    {"kind": "mcp", "server": "server_name", "tool": "tool_name", "inputs": {"param": "value"}}
+  ]
+}
+
 IMPORTANT:
 - Always include proper @mention in final responses!
-- Use ONLY these 4 action types
+- Use ONLY these 5 action types
 - Return valid JSON only
 """
 
 
+def _load_response_json(clean_response: str) -> Any:
+    """
+    Decode the JSON object at the start of a response.
+
+    Models occasionally emit a second action object, or a stray @mention after
+    the JSON. Instead of failing the whole parse, the first object is taken in
+    a single raw_decode() pass; a trailing @mention is carried over to a final
+    text that lacks one.
+    """
+    try:
+        return orjson.loads(clean_response)
+    except orjson.JSONDecodeError:
+        data, end = _JSON_DECODER.raw_decode(clean_response)
+        if not isinstance(data, dict):
+            raise
+
+    if data.get("action") == "final" and isinstance(data.get("text"), str):
+        trailing = _TRAILING_MENTION_RE.search(clean_response, end)
+        if trailing and not _MENTION_RE.search(data["text"]):
+            data["text"] = f"{data['text'].rstrip()} {trailing.group().strip()}"
+    return data
+
+
 def parse_agent_response(raw_response: str) -> AgentResponse:
     """Parse and validate agent response with proper error handling"""
-    import json
-    from pydantic import ValidationError
-
     # Clean the response
-    clean_response = raw_response.strip()
-    if clean_response.startswith("```json"):
-        clean_response = clean_response[7:]
-    if clean_response.endswith("```"):
-        clean_response = clean_response[:-3]
-    clean_response = clean_response.strip()
+    clean_response = (
+        raw_response.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
+    payload = clean_response
+    if not payload.startswith("{"):
+        fenced = _JSON_FENCE_RE.search(payload)
+        if fenced:
+            payload = fenced.group(1)
 
     try:
         # Parse JSON
-        data = json.loads(clean_response)
+        data = _load_response_json(payload)
 
         # Validate based on action type
         action = data.get("action")
@@ -134,6 +201,8 @@ def parse_agent_response(raw_response: str) -> AgentResponse:
             return MCPCallResponse(**data)
         elif action == "self_reflect":
             return SelfReflectResponse(**data)
+        elif action == "parallel_calls":
+            return ParallelCallsResponse(**data)
         else:
             # Unknown action, treat as final response
             return FinalResponse(action="final", text=clean_response)
@@ -144,8 +213,7 @@ def parse_agent_response(raw_response: str) -> AgentResponse:
         print(f"Raw response: {repr(raw_response)}")
 
         # Try to extract @mention if present
-        import re
-        mention_match = re.search(r'@\w+', clean_response)
+        mention_match = _MENTION_RE.search(clean_response)
         if mention_match:
             # Response contains mention, use as-is
             return FinalResponse(action="final", text=clean_response)
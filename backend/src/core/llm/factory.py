@@ -4,8 +4,9 @@
 # =========================================
 from __future__ import annotations
 
+import functools
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 # LangChain unified LLM imports
 from langchain_openai import ChatOpenAI
@@ -58,6 +59,31 @@ class LLM:
         response = await self.langchain_llm.ainvoke(messages)
         return response.content
 
+    def system_message(self, prefix: str, rest: str = "") -> Dict[str, Any]:
+        """
+        System message whose fixed prefix the provider can cache between calls.
+
+        Claude only reuses a prompt prefix up to an explicit cache_control
+        breakpoint, so the prefix becomes its own marked content block. OpenAI
+        caches identical prefixes automatically, and other providers get the
+        plain concatenated text.
+
+        Args:
+            prefix: Part of the system prompt that is identical across calls
+            rest: Part that changes from call to call
+
+        Returns:
+            Message dict accepted by chat() and chat_stream()
+        """
+        if self.provider == "claude":
+            blocks: List[Dict[str, Any]] = [
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+            ]
+            if rest:
+                blocks.append({"type": "text", "text": rest})
+            return {"role": "system", "content": blocks}
+        return {"role": "system", "content": prefix + rest}
+
     async def chat(self, messages: list) -> str:
         """
         Chat with message history.
@@ -349,6 +375,18 @@ def get_llm(provider: Optional[str] = None, model: Optional[str] = None, **kwarg
         raise
 
 
+@functools.lru_cache(maxsize=32)
+def get_cached_llm(provider: Optional[str] = None, model: Optional[str] = None) -> LLM:
+    """
+    Get a shared LLM instance for a (provider, model) pair.
+
+    Agents call this on every turn; the LangChain client (and its HTTP
+    connection pool) is built once and reused instead of per request.
+    Pass extra config to get_llm() directly when a dedicated client is needed.
+    """
+    return get_llm(provider=provider, model=model)
+
+
 def get_llm_from_settings() -> LLM:
     """
     Get LLM using current settings (backward compatibility).
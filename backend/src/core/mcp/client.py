@@ -7,6 +7,7 @@ CLEAN: Zero custom protocol code, pure SDK usage
 """
 from __future__ import annotations
 import asyncio
+import itertools
 import time
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
@@ -22,6 +23,10 @@ from src.core.telemetry.session_logger import session_logger
 
 logger = logging.getLogger(__name__)
 
+# Stamps for tools/list results, unique across all server connections, so a
+# cache keyed on them can't mistake a new tool list for an old one
+_tools_versions = itertools.count(1)
+
 
 @dataclass
 class MCPTool:
@@ -41,6 +46,8 @@ class MCPServerConnection:
         self.session: Optional[ClientSession] = None
         self._exit_stack = None
         self._tools_cache: List[MCPTool] = []
+        self._tools_version = 0  # changes whenever _tools_cache is replaced
+        self._rendered_detail: Optional[str] = None
 
     async def ensure_connected(self):
         """Ensure server is connected (lazy connection) using proper async with pattern."""
@@ -125,6 +132,8 @@ class MCPServerConnection:
 
         # Convert to MCPTool format
         self._tools_cache = []
+        self._tools_version = next(_tools_versions)
+        self._rendered_detail = None
         for tool in result.tools:
             self._tools_cache.append(MCPTool(
                 name=tool.name,
@@ -136,6 +145,38 @@ class MCPServerConnection:
         logger.debug(f"✅ Retrieved {len(self._tools_cache)} tools from {self.name}")
         return self._tools_cache
 
+    def rendered_detail(self) -> str:
+        """
+        Prompt listing of this server's tools and their parameters.
+
+        Rendered once per tools/list result (list_tools() resets it), so agents
+        building system prompts don't re-format every tool description.
+        """
+        if self._rendered_detail is None:
+            parts = [f"Server: {self.name}\n"]
+            for tool in self._tools_cache:
+                desc = tool.description[:100] + "..." if len(tool.description) > 100 else tool.description
+
+                params = tool.parameters.get("properties", {})
+                required_params = tool.parameters.get("required", [])
+
+                param_info: List[str] = []
+                for param_name, param_def in params.items():
+                    param_desc = param_def.get("description", "")[:50]
+                    if len(param_desc) > 47:
+                        param_desc = param_desc[:47] + "..."
+
+                    if param_name in required_params:
+                        param_info.append(f"{param_name}* ({param_desc})")
+                    else:
+                        param_info.append(f"{param_name} ({param_desc})")
+
+                param_str = ", ".join(param_info) if param_info else "none"
+                parts.append(f"  - {tool.name}: {desc}\n    Params: {param_str}\n")
+            parts.append("\n")
+            self._rendered_detail = "".join(parts)
+        return self._rendered_detail
+
     async def call_tool(self, tool_name: str, params: Dict[str, Any]) -> Any:
         """
         Execute tool on server.
@@ -7,12 +7,17 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 DEFAULT_DB_PATH = os.environ.get("AGENTIC_DB_PATH", os.path.join("data", "app.db"))
 
+# Number of most recent messages per group kept in memory for prompt building
+HISTORY_TAIL_SIZE = 20
+
 SCHEMA = """
 PRAGMA journal_mode=WAL;
 
@@ -62,26 +67,35 @@ _cxn.commit()
 # Export connection for other modules that expect _db_conn
 _db_conn: sqlite3.Connection = _cxn
 
+# The connection is shared by the event loop and worker threads
+# (asyncio.to_thread writes from the agents). Every use of _cxn, from
+# execute() to commit(), holds this lock, so one caller's commit can never
+# land in the middle of another's multi-row transaction. Re-entrant because
+# delete_group() calls other functions of this module.
+_db_lock = threading.RLock()
+
 # -------- Groups --------
 
 def create_group(name: str) -> str:
     gid = str(uuid.uuid4())
     now = time.time()
-    _cxn.execute(
-        "INSERT INTO groups (id, name, created_at, updated_at) VALUES (?, ?, ?, ?)",
-        (gid, name, now, now),
-    )
-    _cxn.commit()
+    with _db_lock:
+        _cxn.execute(
+            "INSERT INTO groups (id, name, created_at, updated_at) VALUES (?, ?, ?, ?)",
+            (gid, name, now, now),
+        )
+        _cxn.commit()
     return gid
 
 
 def rename_group(group_id: str, new_name: str) -> None:
     now = time.time()
-    _cxn.execute(
-        "UPDATE groups SET name=?, updated_at=? WHERE id=?",
-        (new_name, now, group_id),
-    )
-    _cxn.commit()
+    with _db_lock:
+        _cxn.execute(
+            "UPDATE groups SET name=?, updated_at=? WHERE id=?",
+            (new_name, now, group_id),
+        )
+        _cxn.commit()
 
 
 def delete_group(group_id: str) -> None:
@@ -170,8 +184,11 @@ def delete_group(group_id: str) -> None:
             print(f"⚠️ Memory cleanup partially failed: {e}")
 
         # 5. Delete group record (FK cascade handles messages and group_agents)
-        _cxn.execute("DELETE FROM groups WHERE id=?", (group_id,))
-        _cxn.commit()
+        with _db_lock:
+            _cxn.execute("DELETE FROM groups WHERE id=?", (group_id,))
+            _cxn.commit()
+        _drop_history_tail(group_id)
+        _drop_group_members(group_id)
 
         # 6. Clean up document files
         files_deleted = 0
@@ -203,8 +220,11 @@ def delete_group(group_id: str) -> None:
     except Exception as e:
         # Ensure we still delete the group even if cleanup fails
         try:
-            _cxn.execute("DELETE FROM groups WHERE id=?", (group_id,))
-            _cxn.commit()
+            with _db_lock:
+                _cxn.execute("DELETE FROM groups WHERE id=?", (group_id,))
+                _cxn.commit()
+            _drop_history_tail(group_id)
+            _drop_group_members(group_id)
             print(f"⚠️ Group {group_id} deleted but cleanup had issues: {e}")
         except Exception as e2:
             print(f"❌ Critical: Failed to delete group {group_id}: {e2}")
@@ -212,42 +232,84 @@ def delete_group(group_id: str) -> None:
 
 
 def list_groups() -> List[Dict[str, Any]]:
-    cur = _cxn.execute(
-        "SELECT id, name, created_at, updated_at FROM groups ORDER BY updated_at DESC"
-    )
+    with _db_lock:
+        rows = _cxn.execute(
+            "SELECT id, name, created_at, updated_at FROM groups ORDER BY updated_at DESC"
+        ).fetchall()
     return [
         {"id": r[0], "name": r[1], "created_at": r[2], "updated_at": r[3]}
-        for r in cur.fetchall()
+        for r in rows
     ]
 
 
 # -------- Group membership --------
 
+# Group membership is read by the router, the orchestrator and every agent's
+# roster on each message, but only changes through the functions below; the
+# member list is cached per group and dropped whenever it is modified.
+_group_members: Dict[str, List[str]] = {}
+
+
+def _drop_group_members(group_id: str) -> None:
+    with _db_lock:
+        _group_members.pop(group_id, None)
+
+
 def add_agent_to_group(group_id: str, agent_key: str) -> None:
-    _cxn.execute(
-        "INSERT OR IGNORE INTO group_agents (group_id, agent_key) VALUES (?,?)",
-        (group_id, agent_key),
-    )
-    _cxn.commit()
+    with _db_lock:
+        _cxn.execute(
+            "INSERT OR IGNORE INTO group_agents (group_id, agent_key) VALUES (?,?)",
+            (group_id, agent_key),
+        )
+        _cxn.commit()
+        _group_members.pop(group_id, None)
 
 
 def remove_agent_from_group(group_id: str, agent_key: str) -> None:
-    _cxn.execute(
-        "DELETE FROM group_agents WHERE group_id=? AND agent_key=?",
-        (group_id, agent_key),
-    )
-    _cxn.commit()
+    with _db_lock:
+        _cxn.execute(
+            "DELETE FROM group_agents WHERE group_id=? AND agent_key=?",
+            (group_id, agent_key),
+        )
+        _cxn.commit()
+        _group_members.pop(group_id, None)
 
 
 def list_group_agents(group_id: str) -> List[str]:
-    cur = _cxn.execute(
-        "SELECT agent_key FROM group_agents WHERE group_id=?", (group_id,)
-    )
-    return [r[0] for r in cur.fetchall()]
+    with _db_lock:
+        members = _group_members.get(group_id)
+        if members is None:
+            cur = _cxn.execute(
+                "SELECT agent_key FROM group_agents WHERE group_id=?", (group_id,)
+            )
+            members = [r[0] for r in cur.fetchall()]
+            _group_members[group_id] = members
+        return list(members)
 
 
 # -------- Messages --------
 
+# Agents rebuild their history context after every planner step. Instead of
+# re-reading the group's messages each time, the last HISTORY_TAIL_SIZE
+# messages per group are kept in memory: seeded from the DB on first use and
+# extended by append_message().
+_history_tails: Dict[str, Deque[Dict[str, Any]]] = {}
+# Bumped whenever a group's messages change, so callers can tell whether a
+# rendering of the tail is still current without re-reading it
+_history_versions: Dict[str, int] = {}
+
+
+def _drop_history_tail(group_id: str) -> None:
+    with _db_lock:
+        _history_tails.pop(group_id, None)
+        _history_versions[group_id] = _history_versions.get(group_id, 0) + 1
+
+
+def get_history_version(group_id: str) -> int:
+    """Counter that changes whenever a message is added to or removed from the group"""
+    return _history_versions.get(group_id, 0)
+
+
 def append_message(
     group_id: str,
     sender: str,
@@ -257,21 +319,137 @@ def append_message(
 ) -> int:
     now = time.time()
     md = json.dumps(metadata or {})
-    cur = _cxn.execute(
-        "INSERT INTO messages (group_id, sender, role, content, metadata, created_at) VALUES (?,?,?,?,?,?)",
-        (group_id, sender, role, content, md, now),
-    )
-    _cxn.commit()
+    with _db_lock:
+        cur = _cxn.execute(
+            "INSERT INTO messages (group_id, sender, role, content, metadata, created_at) VALUES (?,?,?,?,?,?)",
+            (group_id, sender, role, content, md, now),
+        )
+        _cxn.commit()
+        _history_versions[group_id] = _history_versions.get(group_id, 0) + 1
+
+        tail = _history_tails.get(group_id)
+        if tail is not None:
+            tail.append(
+                {
+                    "sender": sender,
+                    "role": role,
+                    "content": content,
+                    "metadata": json.loads(md),
+                    "created_at": now,
+                }
+            )
     return cur.lastrowid
 
 
+def append_messages(group_id: str, messages: List[Dict[str, Any]]) -> List[int]:
+    """
+    Append several messages to a group in one transaction.
+
+    Each message is a dict with sender, role, content and optional metadata.
+    All metadata is serialized before anything is written, so either every
+    message is stored or none is.
+    """
+    now = time.time()
+    rows = [
+        (group_id, m["sender"], m["role"], m["content"], json.dumps(m.get("metadata") or {}), now)
+        for m in messages
+    ]
+    ids: List[int] = []
+    with _db_lock:
+        try:
+            for row in rows:
+                cur = _cxn.execute(
+                    "INSERT INTO messages (group_id, sender, role, content, metadata, created_at) VALUES (?,?,?,?,?,?)",
+                    row,
+                )
+                ids.append(cur.lastrowid)
+            _cxn.commit()
+        except Exception:
+            # Leave nothing behind for the next commit() to persist
+            _cxn.rollback()
+            raise
+        _history_versions[group_id] = _history_versions.get(group_id, 0) + 1
+
+        tail = _history_tails.get(group_id)
+        if tail is not None:
+            for _, sender, role, content, md, ts in rows:
+                tail.append(
+                    {
+                        "sender": sender,
+                        "role": role,
+                        "content": content,
+                        "metadata": json.loads(md),
+                        "created_at": ts,
+                    }
+                )
+    return ids
+
+
+def get_recent_messages(group_id: str) -> List[Dict[str, Any]]:
+    """Return the last HISTORY_TAIL_SIZE messages of a group, oldest first"""
+    with _db_lock:
+        tail = _history_tails.get(group_id)
+        if tail is None:
+            cur = _cxn.execute(
+                "SELECT sender, role, content, metadata, created_at FROM messages WHERE group_id=? ORDER BY id DESC LIMIT ?",
+                (group_id, HISTORY_TAIL_SIZE),
+            )
+            rows = cur.fetchall()
+            rows.reverse()
+            tail = deque(
+                (
+                    {
+                        "sender": sender,
+                        "role": role,
+                        "content": content,
+                        "metadata": json.loads(metadata or "{}"),
+                        "created_at": ts,
+                    }
+                    for sender, role, content, metadata, ts in rows
+                ),
+                maxlen=HISTORY_TAIL_SIZE,
+            )
+            _history_tails[group_id] = tail
+        return list(tail)
+
+
+def get_history_tail(group_id: str, n: int = HISTORY_TAIL_SIZE) -> List[Dict[str, Any]]:
+    """
+    Return the last n messages of a group, oldest first.
+
+    Up to HISTORY_TAIL_SIZE this is served from the in-memory tail; larger
+    tails are read newest-first with LIMIT n, never the whole history.
+    """
+    if n <= 0:
+        return []
+    if n <= HISTORY_TAIL_SIZE:
+        return get_recent_messages(group_id)[-n:]
+    with _db_lock:
+        rows = _cxn.execute(
+            "SELECT sender, role, content, metadata, created_at FROM messages WHERE group_id=? ORDER BY id DESC LIMIT ?",
+            (group_id, n),
+        ).fetchall()
+    rows.reverse()
+    return [
+        {
+            "sender": sender,
+            "role": role,
+            "content": content,
+            "metadata": json.loads(metadata or "{}"),
+            "created_at": ts,
+        }
+        for sender, role, content, metadata, ts in rows
+    ]
+
+
 def get_history(group_id: str, limit: int = 200) -> List[Dict[str, Any]]:
-    cur = _cxn.execute(
-        "SELECT sender, role, content, metadata, created_at FROM messages WHERE group_id=? ORDER BY id ASC LIMIT ?",
-        (group_id, limit),
-    )
+    with _db_lock:
+        rows = _cxn.execute(
+            "SELECT sender, role, content, metadata, created_at FROM messages WHERE group_id=? ORDER BY id ASC LIMIT ?",
+            (group_id, limit),
+        ).fetchall()
     out = []
-    for sender, role, content, metadata, ts in cur.fetchall():
+    for sender, role, content, metadata, ts in rows:
         out.append(
             {
                 "sender": sender,
@@ -324,13 +502,14 @@ def append_document_message(
 
 def get_group_documents(group_id: str) -> List[Dict[str, Any]]:
     """Get all document uploads for a group"""
-    cur = _cxn.execute(
-        "SELECT sender, content, metadata, created_at FROM messages WHERE group_id=? AND role='system' ORDER BY id DESC",
-        (group_id,)
-    )
+    with _db_lock:
+        rows = _cxn.execute(
+            "SELECT sender, content, metadata, created_at FROM messages WHERE group_id=? AND role='system' ORDER BY id DESC",
+            (group_id,)
+        ).fetchall()
     
     documents = []
-    for sender, content, metadata, ts in cur.fetchall():
+    for sender, content, metadata, ts in rows:
         meta = json.loads(metadata or "{}")
         if meta.get("message_type") == "document_upload":
             documents.append({
@@ -345,12 +524,13 @@ def get_group_documents(group_id: str) -> List[Dict[str, Any]]:
 
 def get_document_details(group_id: str, document_id: str) -> Optional[Dict[str, Any]]:
     """Get detailed information about a specific document"""
-    cur = _cxn.execute(
-        "SELECT sender, content, metadata, created_at FROM messages WHERE group_id=? AND role='system'",
-        (group_id,)
-    )
+    with _db_lock:
+        rows = _cxn.execute(
+            "SELECT sender, content, metadata, created_at FROM messages WHERE group_id=? AND role='system'",
+            (group_id,)
+        ).fetchall()
     
-    for sender, content, metadata, ts in cur.fetchall():
+    for sender, content, metadata, ts in rows:
         meta = json.loads(metadata or "{}")
         if meta.get("document_id") == document_id:
             return {
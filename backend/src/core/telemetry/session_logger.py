@@ -15,6 +15,7 @@ from src.core.config.settings import get_settings; settings = get_settings()
 from dataclasses import dataclass, asdict
 from enum import Enum
 import re
+import threading
 
 class LogLevel(str, Enum):
     """Log levels for different types of events"""
@@ -62,6 +63,8 @@ class SessionLogger:
         self.base_log_dir = Path(settings.logging.session_logs_dir)
         self.base_log_dir.mkdir(parents=True, exist_ok=True)
         self._loggers: Dict[str, logging.Logger] = {}
+        # Tool calls are logged from worker threads; guards first-time logger setup
+        self._loggers_lock = threading.Lock()
         self.is_windows = sys.platform == 'win32'
         self._setup_root_logger()
 
@@ -131,6 +134,14 @@ class SessionLogger:
     
     def get_session_logger(self, session_id: str) -> logging.Logger:
         """Get or create a session-specific logger"""
+        session_logger = self._loggers.get(session_id)
+        if session_logger is not None:
+            return session_logger
+        with self._loggers_lock:
+            return self._create_session_logger(session_id)
+
+    def _create_session_logger(self, session_id: str) -> logging.Logger:
+        """Create a session logger and its handlers once (caller holds the lock)"""
         if session_id not in self._loggers:
             logger_name = f"session.{session_id}"
             session_logger = logging.getLogger(logger_name)
@@ -10,6 +10,8 @@ from .event_loop import CrossPlatformEventLoop, platform_loop
 from .platform_commands import CrossPlatformCommands
 from .cross_platform_paths import CrossPlatformPaths
 from .cross_platform_env import CrossPlatformEnv
+from .stat_cache import StatCache, stat_cache
+from .json_files import read_json, write_json_atomic
 
 __all__ = [
     'CrossPlatformEventLoop',
@@ -17,4 +19,8 @@ __all__ = [
     'CrossPlatformCommands',
     'CrossPlatformPaths',
     'CrossPlatformEnv',
+    'StatCache',
+    'stat_cache',
+    'read_json',
+    'write_json_atomic',
 ]
@@ -0,0 +1,67 @@
+"""
+Atomic JSON Config Files
+
+WHY: json.dump(indent=2) is slow and a crash mid-write leaves a truncated file
+WHAT: orjson-based read/write helpers for the JSON files under config/
+HOW: Serialize with orjson, write and fsync a uniquely named sibling temp file, then
+     os.replace() it over the target
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+import orjson
+
+from .stat_cache import stat_cache
+
+PathLike = Union[str, Path]
+
+
+def read_json(path: PathLike) -> Any:
+    """Read and parse a JSON file with orjson"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def write_json_atomic(path: PathLike, data: Any, pretty: bool = True) -> None:
+    """
+    Write data as JSON, replacing the target file atomically.
+
+    Readers either see the previous content or the new content, never a
+    partially written file. Each call writes its own temp file, so concurrent
+    writers can't truncate each other's data; the last os.replace() wins.
+    Cached stats for the path are invalidated.
+
+    Args:
+        path: Target JSON file
+        data: JSON-serializable object
+        pretty: Indent with two spaces (human-edited files); compact otherwise
+    """
+    path = Path(path)
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    payload = orjson.dumps(data, option=option)
+
+    f = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # NamedTemporaryFile creates the file 0600; keep the target's mode
+        try:
+            os.chmod(f.name, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(f.name, 0o644)
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.remove(f.name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    stat_cache.invalidate(path)
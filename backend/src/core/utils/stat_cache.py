@@ -0,0 +1,146 @@
+"""
+Config File Stat Cache
+
+WHY: Config endpoints re-stat and re-parse the same small JSON files on every request
+WHAT: Short-lived cache of os.stat() results (including "missing"), parsed JSON
+      and top-level entry counts
+HOW: Stat entries expire after a TTL; parsed JSON and counts are keyed by (mtime_ns, size)
+     and checked against a fresh stat, so outside edits are never served stale;
+     write paths call invalidate() so their own changes are visible immediately
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import orjson
+
+PathLike = Union[str, Path]
+
+
+class StatCache:
+    """
+    In-process cache of file metadata for frequently polled config files.
+
+    A single os.stat() replaces the exists() + open() idiom: get() returns the
+    cached stat result, or None when the file does not exist.
+    """
+
+    def __init__(self, ttl: float = 1.0):
+        self.ttl = ttl
+        self._stats: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}
+        self._json: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._counts: Dict[str, Tuple[Tuple[int, int], int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: PathLike) -> Optional[os.stat_result]:
+        """Return the (possibly cached) stat result for path, or None if missing"""
+        key = os.fspath(path)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._stats.get(key)
+            if cached is not None and now - cached[0] < self.ttl:
+                return cached[1]
+
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            stat = None
+
+        with self._lock:
+            self._stats[key] = (now, stat)
+        return stat
+
+    def refresh(self, path: PathLike) -> Optional[os.stat_result]:
+        """Stat path now, bypassing the TTL, and cache the result"""
+        with self._lock:
+            self._stats.pop(os.fspath(path), None)
+        return self.get(path)
+
+    def invalidate(self, path: PathLike) -> None:
+        """Drop cached metadata and parsed content for path after a write"""
+        key = os.fspath(path)
+        with self._lock:
+            self._stats.pop(key, None)
+            self._json.pop(key, None)
+            self._counts.pop(key, None)
+
+    def load_json(self, path: PathLike) -> Optional[Any]:
+        """
+        Load a JSON file, reusing the previous parse while the file is unchanged.
+
+        Returns None if the file does not exist. The returned object is shared
+        between callers and must be treated as read-only. The file is always
+        re-stated (a stat is cheap next to a parse), so edits made outside
+        write_json_atomic() are picked up immediately.
+        """
+        key = os.fspath(path)
+        stat = self.refresh(key)
+        if stat is None:
+            return None
+
+        identity = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._json.get(key)
+            if cached is not None and cached[0] == identity:
+                return cached[1]
+
+        with open(key, 'rb') as f:
+            data = orjson.loads(f.read())
+
+        with self._lock:
+            self._json[key] = (identity, data)
+        return data
+
+    def record_count(self, path: PathLike, count: int) -> None:
+        """
+        Remember the entry count of a file that was just written.
+
+        Writers already hold the data they saved, so recording its size here
+        lets count_entries() answer without re-reading the file.
+        """
+        key = os.fspath(path)
+        stat = self.get(key)
+        if stat is None:
+            return
+
+        with self._lock:
+            self._counts[key] = ((stat.st_mtime_ns, stat.st_size), count)
+
+    def count_entries(self, path: PathLike, container: Optional[str] = None) -> Optional[int]:
+        """
+        Count the top-level entries of a JSON object file.
+
+        If container is given and present, entries of data[container] are
+        counted instead (e.g. "mcpServers"). The count is cached per
+        (mtime_ns, size), so the file is parsed at most once per change and
+        the parsed values are not retained. Like load_json(), it checks a fresh
+        stat. Returns None if the file is missing.
+        """
+        key = os.fspath(path)
+        stat = self.refresh(key)
+        if stat is None:
+            return None
+
+        identity = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None and cached[0] == identity:
+                return cached[1]
+
+        with open(key, 'rb') as f:
+            data = orjson.loads(f.read())
+        if container is not None and container in data:
+            data = data[container]
+        count = len(data)
+
+        with self._lock:
+            self._counts[key] = (identity, count)
+        return count
+
+
+# Global stat cache instance
+stat_cache = StatCache()
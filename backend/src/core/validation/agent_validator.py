@@ -5,6 +5,7 @@ Validates agent configurations using the exact same logic as registry.py
 REFACTORED: Delegates to ToolValidator and McpValidator to eliminate code duplication (DRY principle)
 """
 
+import asyncio
 import os
 import yaml
 import json
@@ -38,13 +39,26 @@ class AgentValidator:
         AgentValidator._validate_basic_fields(result, name, description, emoji, agent_key)
 
         # DELEGATE to specialized validators (DRY principle)
+        # The checks are independent and synchronous (the tools check imports
+        # the code), so they run concurrently in worker threads, each into its
+        # own result; results are merged in a fixed order afterwards
+        checks = []
         # 1. Validate tools code (delegate to ToolValidator)
         if tools_code:
-            AgentValidator._validate_tools_code(result, tools_code)
+            checks.append((AgentValidator._validate_tools_code, tools_code))
 
         # 2. Validate MCP config (delegate to McpValidator)
         if mcp_config:
-            AgentValidator._validate_mcp_config(result, mcp_config)
+            checks.append((AgentValidator._validate_mcp_config, mcp_config))
+
+        if checks:
+            sub_results = [ValidationResult(valid=True, errors=[], warnings=[]) for _ in checks]
+            await asyncio.gather(*(
+                asyncio.to_thread(check, sub_result, value)
+                for (check, value), sub_result in zip(checks, sub_results)
+            ))
+            for sub_result in sub_results:
+                result.merge(sub_result)
 
         # If validation already failed, don't attempt build
         if not result.valid:
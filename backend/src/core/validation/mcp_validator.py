@@ -6,6 +6,7 @@ Leverages cross-platform utilities for command resolution and event loop managem
 
 from typing import Dict, Any, List
 import asyncio
+import functools
 
 from .validation_result import ValidationResult
 from src.core.utils.platform_commands import CrossPlatformCommands
@@ -237,10 +238,12 @@ class McpValidator:
         McpValidator._validate_server_config(result, server_name, server_config)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_common_mcp_templates() -> List[Dict[str, Any]]:
         """
         Return common MCP server configuration templates
         These are pre-validated configurations for popular MCP servers
+        Built once and cached; callers must treat the list as read-only
         """
         return [
             {
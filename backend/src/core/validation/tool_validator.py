@@ -5,10 +5,37 @@ as agent tool registration.
 """
 
 import ast
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 
 from .validation_result import ValidationResult
 
+# validate_tool_config is a pure function of its inputs (AST analysis only),
+# so results are memoized by a digest of the canonicalized arguments. Form
+# autosave re-submits identical configs and hits the cache.
+_CONFIG_CACHE_SIZE = 512
+_config_cache: "OrderedDict[bytes, ValidationResult]" = OrderedDict()
+_config_cache_lock = threading.Lock()
+
+
+def _config_cache_key(*parts: Any) -> bytes:
+    """Digest of the canonical JSON encoding of the validator arguments"""
+    canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+# Form autosave replays the same code repeatedly; parsing it is the expensive
+# part of the static checks, so the AST is cached by source text. It is only
+# read (ast.walk), never mutated, so sharing it between callers is safe.
+@functools.lru_cache(maxsize=128)
+def _parse_tool_code(code: str) -> ast.Module:
+    """Parse tool code once per distinct source"""
+    return ast.parse(code)
+
 
 class ToolValidator:
     """Validates tool configurations and Python code before creation/modification"""
@@ -25,6 +52,33 @@ class ToolValidator:
         Validate tool configuration using the same logic as agent tool registration
         This mirrors the exact validation that happens during tool discovery and loading
         """
+        if not isinstance(functions, list):
+            return ToolValidator._validate_tool_config(name, description, category, code, functions)
+
+        key = _config_cache_key(name, description, category, code, functions)
+        with _config_cache_lock:
+            cached = _config_cache.get(key)
+            if cached is not None:
+                _config_cache.move_to_end(key)
+                return cached.copy()
+
+        result = ToolValidator._validate_tool_config(name, description, category, code, functions)
+
+        with _config_cache_lock:
+            _config_cache[key] = result.copy()
+            if len(_config_cache) > _CONFIG_CACHE_SIZE:
+                _config_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _validate_tool_config(
+        name: str,
+        description: str,
+        category: str,
+        code: str,
+        functions: List[str]
+    ) -> ValidationResult:
+        """Uncached implementation of validate_tool_config"""
         result = ValidationResult(valid=True, errors=[], warnings=[])
 
         # Validate basic fields
@@ -52,7 +106,7 @@ class ToolValidator:
 
         # Test compilation (same as importlib.util.spec_from_file_location would do)
         try:
-            ast.parse(code)
+            _parse_tool_code(code)
         except SyntaxError as e:
             result.add_error(
                 "code",
@@ -117,7 +171,7 @@ class ToolValidator:
 
         # Parse code for analysis
         try:
-            tree = ast.parse(code)
+            tree = _parse_tool_code(code)
         except SyntaxError as e:
             result.add_error("code", f"Python syntax error: {str(e)}", "SYNTAX_ERROR", {
                 "line": e.lineno,
@@ -139,7 +193,9 @@ class ToolValidator:
                 # Check for @agent_tool decorator (same logic as register_tools_from_module)
                 has_agent_tool_decorator = False
                 for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Name) and decorator.id == "agent_tool":
+                    if isinstance(decorator, ast.Call):
+                        decorator = decorator.func  # @agent_tool_cached(ttl=...)
+                    if isinstance(decorator, ast.Name) and decorator.id in ("agent_tool", "agent_tool_cached"):
                         has_agent_tool_decorator = True
                         break
 
@@ -175,7 +231,7 @@ class ToolValidator:
             if isinstance(node, ast.ImportFrom):
                 if node.module and "base_agent" in node.module:
                     for alias in node.names:
-                        if alias.name == "agent_tool":
+                        if alias.name in ("agent_tool", "agent_tool_cached"):
                             has_agent_tool_import = True
                             break
 
@@ -280,7 +336,7 @@ class ToolValidator:
         """Validate that declared function names actually exist in the code"""
 
         try:
-            tree = ast.parse(code)
+            tree = _parse_tool_code(code)
         except SyntaxError:
             return  # Syntax errors already handled elsewhere
 
@@ -364,6 +420,7 @@ class ToolValidator:
             result.add_error("code", f"Tool registration failed: {str(e)}", "REGISTRATION_ERROR")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_tool_code_template() -> str:
         """Return a basic template for tool code"""
         return '''"""
@@ -402,8 +459,9 @@ def another_function(data: dict) -> bool:
 '''
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_common_tool_patterns() -> List[Dict[str, Any]]:
-        """Return common tool patterns and examples"""
+        """Return common tool patterns and examples (cached; treat as read-only)"""
         return [
             {
                 "name": "Data Processing Tool",
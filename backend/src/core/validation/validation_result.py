@@ -15,7 +15,7 @@ class ValidationSeverity(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Represents a validation error that prevents successful registration"""
     field: str
@@ -24,7 +24,7 @@ class ValidationError:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationWarning:
     """Represents a validation warning that doesn't prevent registration"""
     field: str
@@ -33,9 +33,14 @@ class ValidationWarning:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Complete validation result with errors, warnings, and success status"""
+    """
+    Complete validation result with errors, warnings, and success status.
+
+    Results are created for every validation request; slots drop the
+    per-instance __dict__ and to_dict() builds its payload from literals.
+    """
     valid: bool
     errors: List[ValidationError]
     warnings: List[ValidationWarning]
@@ -90,6 +95,21 @@ class ValidationResult:
         """Add a validation warning"""
         self.warnings.append(ValidationWarning(field, message, code, details))
 
+    def merge(self, other: 'ValidationResult'):
+        """Append another result's errors and warnings to this one"""
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        if not other.valid:
+            self.valid = False
+
+    def copy(self) -> 'ValidationResult':
+        """Return a copy whose error and warning lists can be extended independently"""
+        return ValidationResult(
+            valid=self.valid,
+            errors=list(self.errors),
+            warnings=list(self.warnings)
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses"""
         return {